@@ -8,7 +8,9 @@ with AND/OR logic. Conditions can be nested to arbitrary depth to express querie
 - ((filter1 AND filter2) OR (filter3 AND filter4))
 """
 import logging
-from dataclasses import dataclass
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set
 
@@ -22,13 +24,17 @@ class ConditionType(Enum):
     LEAF = "leaf"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FilterCondition:
     """
     Represents a leaf condition (actual filter).
 
     This encapsulates all possible filter types that can be applied
     to assets in a single API call or client-side filtering operation.
+
+    Instances are immutable (use dataclasses.replace() to derive a changed
+    condition), so the cache key, search parameters, has_filters() and repr
+    are computed once at construction.
     """
     # Favorite filter
     is_favorite: Optional[bool] = None
@@ -50,9 +56,46 @@ class FilterCondition:
     # Resolution filter (list of [width, height] pairs)
     resolution: Optional[List[List[int]]] = None
 
-    def has_filters(self) -> bool:
-        """Check if this condition has any filters set."""
-        return any([
+    # Known to match nothing (e.g. an AND of contradictory filters); such a
+    # condition is answered without any API call
+    is_empty: bool = False
+
+    # Derived from the fields above in __post_init__
+    _cache_key: tuple = field(init=False, repr=False, compare=False)
+    _search_params: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    _has_filters: bool = field(init=False, repr=False, compare=False)
+    _repr: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        def _tuple(values):
+            return None if values is None else tuple(sorted(values))
+
+        object.__setattr__(self, "_cache_key", (
+            self.is_favorite,
+            _tuple(self.asset_types),
+            self.camera_make,
+            self.camera_model,
+            _tuple(self.person_ids),
+            _tuple(self.include_tags),
+            _tuple(self.exclude_tags),
+            None if self.resolution is None else tuple(map(tuple, self.resolution)),
+            self.is_empty,
+        ))
+
+        params = {}
+        if self.is_favorite is not None:
+            params["is_favorite"] = self.is_favorite
+        if self.asset_types is not None:
+            params["asset_types"] = self.asset_types
+        if self.camera_make:
+            params["camera_make"] = self.camera_make
+        if self.camera_model:
+            params["camera_model"] = self.camera_model
+        if self.person_ids:
+            params["include_people_ids"] = self.person_ids
+        object.__setattr__(self, "_search_params", params)
+
+        object.__setattr__(self, "_has_filters", any([
             self.is_favorite is not None,
             self.asset_types is not None,
             self.camera_make is not None,
@@ -61,9 +104,11 @@ class FilterCondition:
             self.include_tags is not None,
             self.exclude_tags is not None,
             self.resolution is not None,
-        ])
+        ]))
 
-    def __repr__(self):
+        if self.is_empty:
+            object.__setattr__(self, "_repr", "FilterCondition(empty)")
+            return
         parts = []
         if self.is_favorite is not None:
             parts.append(f"favorite={self.is_favorite}")
@@ -81,7 +126,72 @@ class FilterCondition:
             parts.append(f"tags-={self.exclude_tags}")
         if self.resolution:
             parts.append(f"resolution={len(self.resolution)} sizes")
-        return f"FilterCondition({', '.join(parts)})"
+        object.__setattr__(self, "_repr", f"FilterCondition({', '.join(parts)})")
+
+    def __hash__(self):
+        return hash(self._cache_key)
+
+    def search_params(self) -> Dict[str, Any]:
+        """
+        Return this condition's filters as search_assets keyword arguments.
+
+        Callers must not modify the returned dict.
+        """
+        return self._search_params
+
+    def _key(self) -> tuple:
+        """
+        Canonical, hashable form of this condition's filters.
+
+        Two conditions with equal keys select the same assets, so the key is
+        used to share leaf results within one tree evaluation.
+        """
+        return self._cache_key
+
+    def has_filters(self) -> bool:
+        """Check if this condition has any filters set."""
+        return self._has_filters
+
+    def implies(self, other: 'FilterCondition') -> bool:
+        """
+        Check whether every asset matching this condition also matches other.
+
+        Conservative: returns False whenever that can't be shown from the
+        filters alone. A condition without filters matches the base assets when
+        there are any and nothing otherwise, so it only implies (and is only
+        implied by) another condition without filters.
+        """
+        # Conditions that match nothing imply anything, and are implied by nothing
+        if self.is_empty or self.person_ids == []:
+            return True
+        if other.is_empty or other.person_ids == []:
+            return False
+        if not self.has_filters() or not other.has_filters():
+            return self.has_filters() == other.has_filters()
+
+        for name in ("is_favorite", "camera_make", "camera_model", "include_tags", "exclude_tags"):
+            value = getattr(other, name)
+            if value is not None and getattr(self, name) != value:
+                return False
+
+        # Immich requires ALL listed people, so more people is narrower
+        if other.person_ids and not set(other.person_ids) <= set(self.person_ids or ()):
+            return False
+
+        if other.resolution is not None and (
+            self.resolution is None
+            or not set(map(tuple, self.resolution)) <= set(map(tuple, other.resolution))
+        ):
+            return False
+
+        # An unset asset_types means whatever search_assets defaults to, so it
+        # is only comparable with another unset one
+        if other.asset_types is None or self.asset_types is None:
+            return self.asset_types is other.asset_types
+        return set(self.asset_types) <= set(other.asset_types)
+
+    def __repr__(self):
+        return self._repr
 
 
 class ConditionNode:
@@ -94,6 +204,18 @@ class ConditionNode:
     - OR nodes union results from all children
     """
 
+    # Maximum concurrent searches when an OR node fetches its leaves
+    MAX_PARALLEL_LEAVES = 8
+
+    # Leaf filters from most to least selective, with their selectivity score
+    SELECTIVITY_ORDER = (
+        ("person_ids", 0),
+        ("camera_model", 1),
+        ("camera_make", 2),
+        ("is_favorite", 3),
+        ("asset_types", 4),
+    )
+
     def __init__(
         self,
         node_type: ConditionType,
@@ -119,6 +241,8 @@ class ConditionNode:
         elif node_type == ConditionType.LEAF:
             if condition is None:
                 raise ValueError("LEAF node must have a condition")
+        else:
+            raise ValueError(f"Unknown node type: {node_type}")
 
     @classmethod
     def from_config(cls, config: Any, people_resolver=None) -> 'ConditionNode':
@@ -148,32 +272,78 @@ class ConditionNode:
             {"or": [{"and": [...]}, {"and": [...]}]}
             → OR node with 2 AND children
         """
-        # Check if this is a logical operator
-        if isinstance(config, dict):
-            if "and" in config:
-                # AND node
-                operands = config["and"]
+        # Parsed without recursion: each frame is [node type, operand configs,
+        # children built so far]. Children are built before their parent so
+        # that _intern() can key a node by its (already shared) children.
+        stack = []
+        while True:
+            # Check if this is a logical operator
+            if not isinstance(config, dict):
+                raise ValueError(f"Invalid condition config type: {type(config).__name__}")
+
+            if "and" in config or "or" in config:
+                # AND/OR node: parse its operands first
+                key = "and" if "and" in config else "or"
+                operands = config[key]
                 if not isinstance(operands, list):
-                    raise ValueError("'and:' must be a list of conditions")
-
-                children = [cls.from_config(operand, people_resolver) for operand in operands]
-                return cls(ConditionType.AND, children=children)
+                    raise ValueError(f"'{key}:' must be a list of conditions")
+                stack.append([ConditionType(key), operands, []])
+                node = None
+            else:
+                # Leaf condition
+                node = cls._parse_leaf_condition(config, people_resolver)
+
+            # Hand finished nodes to their parents until one needs another operand
+            while True:
+                if node is not None:
+                    if not stack:
+                        return node
+                    stack[-1][2].append(node)
+
+                node_type, operands, children = stack[-1]
+                if len(children) < len(operands):
+                    config = operands[len(children)]
+                    break
+                stack.pop()
+                node = cls._intern(node_type, children=children)
 
-            elif "or" in config:
-                # OR node
-                operands = config["or"]
-                if not isinstance(operands, list):
-                    raise ValueError("'or:' must be a list of conditions")
+    @classmethod
+    def _intern(
+        cls,
+        node_type: ConditionType,
+        children: Optional[List['ConditionNode']] = None,
+        condition: Optional[FilterCondition] = None,
+    ) -> 'ConditionNode':
+        """
+        Return the parsed node for this structure, creating it only once.
 
-                children = [cls.from_config(operand, people_resolver) for operand in operands]
-                return cls(ConditionType.OR, children=children)
+        Rules often repeat the same sub-condition; identical subtrees from
+        from_config share one ConditionNode instead of each building a copy.
+        Sharing is only safe because nodes are never modified after parsing;
+        optimize() builds new nodes rather than rewriting shared ones.
 
-            else:
-                # Leaf condition
-                return cls._parse_leaf_condition(config, people_resolver)
+        Args:
+            node_type: Type of node (AND, OR, LEAF)
+            children: Child nodes built by from_config (for AND/OR nodes)
+            condition: Filter condition (for LEAF nodes)
 
+        Returns:
+            Shared ConditionNode
+        """
+        if condition is not None:
+            key = (node_type, condition._key())
         else:
-            raise ValueError(f"Invalid condition config type: {type(config).__name__}")
+            # Children are interned already, so identical subtrees are the same
+            # objects and the key can hold the nodes themselves (hashed by
+            # identity). Hashing stays O(children) however deep the tree is,
+            # and the key keeps the children alive while the entry exists.
+            key = (node_type, tuple(children))
+
+        node = _INTERNED_NODES.get(key)
+        if node is None:
+            node = cls(node_type, children=children, condition=condition)
+            _INTERNED_NODES[key] = node
+        return node
 
     @classmethod
     def _parse_leaf_condition(cls, config: Dict, people_resolver=None) -> 'ConditionNode':
@@ -187,25 +357,25 @@ class ConditionNode:
         Returns:
             LEAF ConditionNode
         """
-        condition = FilterCondition()
+        fields = {}
 
         # Parse is_favorite
         if "is_favorite" in config:
-            condition.is_favorite = config["is_favorite"]
+            fields["is_favorite"] = config["is_favorite"]
 
         # Parse asset_types
         if "asset_types" in config:
             asset_types = config["asset_types"]
             if not isinstance(asset_types, list):
                 asset_types = [asset_types]
-            condition.asset_types = [t.upper() for t in asset_types]
+            fields["asset_types"] = list(map(str.upper, asset_types))
 
         # Parse camera filters
         if "camera" in config:
             camera = config["camera"]
             if isinstance(camera, dict):
-                condition.camera_make = camera.get("make")
-                condition.camera_model = camera.get("model")
+                fields["camera_make"] = camera.get("make")
+                fields["camera_model"] = camera.get("model")
 
         # Parse people filter
         if "people" in config:
@@ -217,19 +387,19 @@ class ConditionNode:
                 if include_people and people_resolver:
                     person_ids = people_resolver.resolve_people_names(include_people)
                     if person_ids:
-                        condition.person_ids = person_ids
+                        fields["person_ids"] = person_ids
                     else:
                         logger.warning(f"No valid people found for: {include_people}")
                         # Set to empty list to indicate filter was requested but no matches
                         # This will cause evaluation to return empty set instead of all assets
-                        condition.person_ids = []
+                        fields["person_ids"] = []
 
         # Parse tags (for future implementation)
         if "tags" in config:
             tags = config["tags"]
             if isinstance(tags, dict):
-                condition.include_tags = tags.get("include")
-                condition.exclude_tags = tags.get("exclude")
+                fields["include_tags"] = tags.get("include")
+                fields["exclude_tags"] = tags.get("exclude")
 
         # Parse resolution filter
         if "resolution" in config:
@@ -237,69 +407,186 @@ class ConditionNode:
             if isinstance(resolution, dict):
                 include_resolutions = resolution.get("include", [])
                 if include_resolutions:
-                    condition.resolution = include_resolutions
+                    fields["resolution"] = include_resolutions
 
-        return cls(ConditionType.LEAF, condition=condition)
+        return cls._intern(ConditionType.LEAF, condition=FilterCondition(**fields))
 
     def evaluate(
         self,
         client,
         base_assets: Optional[Set[str]] = None,
         date_filters: Optional[Dict] = None,
+        cache: Optional[Dict[tuple, Set[str]]] = None,
     ) -> Set[str]:
         """
-        Recursively evaluate the condition tree.
+        Evaluate the condition tree.
+
+        The tree is walked with an explicit stack of frames rather than by
+        recursing into children, so deeply nested conditions cost no Python
+        call frames and can't hit the recursion limit.
 
         Args:
             client: ImmichClient instance for API calls
-            base_assets: Optional set of assets to filter (from date-range query)
+            base_assets: Optional set of assets to filter (from date-range query);
+                         frozen by the top-level call
             date_filters: Optional dict with date range filters to apply
+            cache: Leaf results for this evaluation, keyed by FilterCondition._key().
+                   Created by the top-level call and shared with every leaf, so
+                   identical leaves anywhere in the tree query the API once;
+                   entries are dropped after their last use.
 
         Returns:
             Set of asset IDs that match this condition
         """
+        if cache is None:
+            # Top-level call: freeze the base set once so every leaf (and the
+            # caller) can share the same object without risk of it changing
+            cache = {}
+            if base_assets is not None and not isinstance(base_assets, frozenset):
+                base_assets = frozenset(base_assets)
+
+        # Occurrences of each distinct leaf still to be evaluated. A cached
+        # result is released after its last use, so only results that will be
+        # needed again stay alive alongside the running AND/OR accumulators.
+        remaining = Counter(
+            node.condition._key() for node in self._walk() if node.node_type == ConditionType.LEAF
+        )
+
         if self.node_type == ConditionType.LEAF:
-            return self._evaluate_leaf(client, base_assets, date_filters)
+            return self._evaluate_leaf_cached(client, base_assets, date_filters, cache, remaining)
+
+        # Each frame is [node, index of next child to evaluate, result so far]
+        # and only AND/OR nodes get one: node types are checked in __init__,
+        # and leaf children are evaluated in place as their parent reaches
+        # them. AND results start as None (nothing intersected yet), OR
+        # results as a new set(); both are then updated in place as children
+        # finish.
+        stack = [[self, 0, None if self.node_type == ConditionType.AND else set()]]
+
+        while True:
+            frame = stack[-1]
+            node, index, result = frame
+
+            if index < len(node.children):
+                child = node.children[index]
+                frame[1] = index + 1
+                if index == 0:
+                    logger.debug(f"{node.node_type.name} node evaluating {len(node.children)} children")
+                    if node.node_type == ConditionType.OR:
+                        node._prefetch_leaves(client, base_assets, date_filters, cache)
+                logger.debug(f"{node.node_type.name} child {index + 1}/{len(node.children)}: {child.node_type}")
+
+                if child.node_type != ConditionType.LEAF:
+                    # Descend; the child's result is folded in once it finishes
+                    stack.append([child, 0, None if child.node_type == ConditionType.AND else set()])
+                    continue
+                result = child._evaluate_leaf_cached(client, base_assets, date_filters, cache, remaining)
 
-        elif self.node_type == ConditionType.AND:
-            # Intersection of all children
-            if not self.children:
-                return set()
-
-            logger.debug(f"AND node evaluating {len(self.children)} children")
-            result = None
-            for i, child in enumerate(self.children):
-                logger.debug(f"AND child {i+1}/{len(self.children)}: {child.node_type}")
-                child_result = child.evaluate(client, base_assets, date_filters)
-                logger.debug(f"AND child {i+1} returned {len(child_result)} assets")
+            else:
+                # This node is finished: fold its result into the parent
                 if result is None:
-                    result = child_result
+                    # AND with no children
+                    result = set()
+                stack.pop()
+                if not stack:
+                    return result
+                frame = stack[-1]
+                node = frame[0]
+
+            logger.debug(f"{node.node_type.name} child {frame[1]} returned {len(result)} assets")
+
+            if node.node_type == ConditionType.AND:
+                # Intersection of all children
+                # (in place, on a copy of the first child's set, which may be
+                # shared through the leaf cache or be base_assets itself)
+                if frame[2] is None:
+                    frame[2] = set(result)
                 else:
-                    result = result & child_result
-                    logger.debug(f"AND intersection: {len(result)} assets remain")
+                    frame[2].intersection_update(result)
+                    logger.debug(f"AND intersection: {len(frame[2])} assets remain")
 
                 # Early exit if result is empty
-                if not result:
+                if not frame[2]:
                     logger.debug("AND early exit: empty result")
-                    return set()
+                    frame[1] = len(node.children)
+            else:
+                # Union of all children
+                frame[2] |= result
+                logger.debug(f"OR union: {len(frame[2])} assets total")
+
+                # Early exit once every base asset matches: results never leave
+                # base_assets, so equal size means nothing more can be added
+                if base_assets is not None and len(frame[2]) >= len(base_assets):
+                    logger.debug("OR early exit: all base assets matched")
+                    frame[1] = len(node.children)
+
+    def _walk(self):
+        """Yield every node of the tree, parents before their children (no recursion)."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children)
+
+    def _prefetch_leaves(
+        self,
+        client,
+        base_assets: Optional[Set[str]],
+        date_filters: Optional[Dict],
+        cache: Dict[tuple, Set[str]],
+    ):
+        """
+        Evaluate this OR node's leaf children concurrently into the leaf cache.
 
-            return result if result is not None else set()
+        OR needs every child's result (there is no early exit), and each leaf
+        is an independent, I/O-bound search, so they are run in parallel and
+        the normal walk then picks the results up from the cache. AND children
+        stay sequential to keep the early exit on an empty intersection.
+        """
+        pending = {}
+        for child in self.children:
+            if child.node_type == ConditionType.LEAF:
+                key = child.condition._key()
+                if key not in cache:
+                    pending.setdefault(key, child)
 
-        elif self.node_type == ConditionType.OR:
-            # Union of all children
-            result = set()
-            logger.debug(f"OR node evaluating {len(self.children)} children")
-            for i, child in enumerate(self.children):
-                logger.debug(f"OR child {i+1}/{len(self.children)}: {child.node_type}")
-                child_result = child.evaluate(client, base_assets, date_filters)
-                logger.debug(f"OR child {i+1} returned {len(child_result)} assets")
-                result = result | child_result
-                logger.debug(f"OR union: {len(result)} assets total")
+        if len(pending) < 2:
+            return
 
-            return result
+        from concurrent.futures import ThreadPoolExecutor
 
-        else:
-            raise ValueError(f"Unknown node type: {self.node_type}")
+        logger.debug(f"OR node fetching {len(pending)} leaves in parallel")
+        with ThreadPoolExecutor(max_workers=min(len(pending), self.MAX_PARALLEL_LEAVES)) as executor:
+            futures = {
+                key: executor.submit(leaf._evaluate_leaf, client, base_assets, date_filters)
+                for key, leaf in pending.items()
+            }
+            for key, future in futures.items():
+                cache[key] = future.result()
+
+    def _evaluate_leaf_cached(
+        self,
+        client,
+        base_assets: Optional[Set[str]],
+        date_filters: Optional[Dict],
+        cache: Dict[tuple, Set[str]],
+        remaining: Counter,
+    ) -> Set[str]:
+        """
+        Evaluate a leaf, reusing the result of an identical leaf from the cache.
+
+        The result is only kept in the cache while another occurrence of the
+        same leaf is still to be evaluated (per the remaining counter).
+        """
+        key = self.condition._key()
+        remaining[key] -= 1
+        if key in cache:
+            logger.debug(f"Reusing result for identical leaf: {self.condition}")
+            return cache[key] if remaining[key] > 0 else cache.pop(key)
+        result = self._evaluate_leaf(client, base_assets, date_filters)
+        if remaining[key] > 0:
+            cache[key] = result
+        return result
 
     def _evaluate_leaf(
         self,
@@ -318,37 +605,24 @@ class ConditionNode:
         Returns:
             Set of asset IDs matching this leaf condition
         """
+        if self.condition.is_empty:
+            logger.debug("Condition can never match - returning empty set")
+            return set()
+
         if not self.condition or not self.condition.has_filters():
             # No filters - return base assets or empty set
             return base_assets if base_assets is not None else set()
 
-        # Build search parameters
-        search_params = {}
+        # Empty list means filter was requested but no valid people found
+        # Return empty set immediately (no matches possible)
+        if self.condition.person_ids is not None and len(self.condition.person_ids) == 0:
+            logger.debug("People filter requested but no valid people found - returning empty set")
+            return set()
 
-        # Add date filters if provided
+        # This condition's filters are compiled once; date filters are per evaluation
+        search_params = self.condition.search_params()
         if date_filters:
-            search_params.update(date_filters)
-
-        # Add this condition's filters
-        if self.condition.is_favorite is not None:
-            search_params["is_favorite"] = self.condition.is_favorite
-
-        if self.condition.asset_types is not None:
-            search_params["asset_types"] = self.condition.asset_types
-
-        if self.condition.camera_make:
-            search_params["camera_make"] = self.condition.camera_make
-
-        if self.condition.camera_model:
-            search_params["camera_model"] = self.condition.camera_model
-
-        if self.condition.person_ids is not None:
-            # Empty list means filter was requested but no valid people found
-            # Return empty set immediately (no matches possible)
-            if len(self.condition.person_ids) == 0:
-                logger.debug("People filter requested but no valid people found - returning empty set")
-                return set()
-            search_params["include_people_ids"] = self.condition.person_ids
+            search_params = {**date_filters, **search_params}
 
         # Make API call
         logger.debug(f"Evaluating leaf condition: {self.condition}")
@@ -377,105 +651,277 @@ class ConditionNode:
         Optimizations:
         1. Combine adjacent AND LEAF nodes into single API call
         2. Flatten nested AND/OR nodes of same type
-        3. Remove empty nodes
+        3. Drop OR leaves implied by a sibling leaf, and merge OR leaves that
+           differ only in asset types into one API call
+        4. Remove empty nodes
+
+        Nodes are never modified: parsed subtrees are shared between rules
+        (see _intern), so any node that changes is rebuilt instead.
 
         Returns:
             Optimized ConditionNode (may be self)
         """
-        # Recursively optimize children first
-        if self.children:
-            self.children = [child.optimize() for child in self.children]
+        # Collect nodes parent-first with an explicit stack, then optimize them
+        # in reverse so every node's children are already optimized (no
+        # recursion, however deep the tree)
+        order = list(self._walk())
+
+        optimized: Dict[int, 'ConditionNode'] = {}
+        # Selectivity of every optimized AND/OR node, filled in bottom-up. The
+        # nodes stay alive in `optimized`, so their ids can't be reused.
+        scores: Dict[int, int] = {}
+        for node in reversed(order):
+            # Shared (interned) subtrees can appear more than once
+            if id(node) in optimized:
+                continue
+            children = [optimized[id(child)] for child in node.children]
+            result = node._optimize_node(children, scores)
+            optimized[id(node)] = result
+            if result.node_type != ConditionType.LEAF:
+                scores[id(result)] = ConditionNode._selectivity_score(result, scores)
+
+        return optimized[id(self)]
+
+    def _optimize_node(self, children: List['ConditionNode'], scores: Dict[int, int]) -> 'ConditionNode':
+        """
+        Apply the optimizations to this node, given its already optimized children.
+
+        Args:
+            children: This node's children after optimization (empty for leaves)
+            scores: Selectivity scores of the optimized AND/OR nodes, by id
+
+        Returns:
+            Optimized ConditionNode (self if nothing changed)
+        """
+        if self.node_type == ConditionType.LEAF:
+            return self
 
         # Optimization 1: Flatten nested nodes of same type
-        if self.node_type in (ConditionType.AND, ConditionType.OR):
-            flattened_children = []
-            for child in self.children:
-                if child.node_type == self.node_type:
-                    # Merge same-type child's children into this level
-                    flattened_children.extend(child.children)
-                else:
-                    flattened_children.append(child)
-            self.children = flattened_children
+        flattened_children = []
+        for child in children:
+            if child.node_type == self.node_type:
+                # Merge same-type child's children into this level
+                flattened_children.extend(child.children)
+            else:
+                flattened_children.append(child)
+        children = flattened_children
 
         # Optimization 2: Combine adjacent AND LEAF nodes
         if self.node_type == ConditionType.AND:
-            combined = self._combine_and_leaves()
+            combined = self._combine_and_leaves(children)
             if combined:
                 return combined
 
-        # Optimization 3: Simplify single-child AND/OR nodes
-        if self.node_type in (ConditionType.AND, ConditionType.OR):
-            if len(self.children) == 1:
-                # Single child - return it directly
-                return self.children[0]
-            elif len(self.children) == 0:
-                # Empty node - return empty leaf
-                return ConditionNode(ConditionType.LEAF, condition=FilterCondition())
+            # Evaluate the most selective children first so the AND's
+            # early exit on an empty result triggers as soon as possible
+            children.sort(key=lambda child: ConditionNode._selectivity_score(child, scores))
+
+        # Optimization 3: Drop OR leaves covered by a broader sibling, then
+        # merge leaves that only differ in asset types
+        if self.node_type == ConditionType.OR:
+            children = self._merge_or_leaves(self._absorb_or_leaves(children))
+
+        # Optimization 4: Simplify single-child AND/OR nodes
+        if len(children) == 1:
+            # Single child - return it directly
+            return children[0]
+        elif len(children) == 0:
+            # Empty node - return empty leaf
+            return ConditionNode(ConditionType.LEAF, condition=FilterCondition())
+
+        if children == self.children:
+            return self
+        return ConditionNode(self.node_type, children=children)
+
+    @staticmethod
+    def _selectivity_score(node: 'ConditionNode', scores: Dict[int, int]) -> int:
+        """
+        Estimate how selective a node is (lower = matches fewer assets).
 
-        return self
+        A leaf scores by its most selective filter. An AND node is as selective
+        as its most selective child, an OR node only as its least selective one.
+        Child AND/OR scores are looked up in scores rather than recomputed, so
+        this never recurses however deep the tree is.
 
-    def _combine_and_leaves(self) -> Optional['ConditionNode']:
+        Args:
+            node: Node to score
+            scores: Already computed scores of AND/OR nodes, by id
+        """
+        if node.node_type != ConditionType.LEAF:
+            if id(node) in scores:
+                return scores[id(node)]
+            child_scores = [
+                scores[id(child)] if child.node_type != ConditionType.LEAF
+                else ConditionNode._selectivity_score(child, scores)
+                for child in node.children
+            ]
+            return min(child_scores) if node.node_type == ConditionType.AND else max(child_scores)
+
+        condition = node.condition
+        if condition.is_empty:
+            return -1
+        for attr, score in ConditionNode.SELECTIVITY_ORDER:
+            if getattr(condition, attr) is not None:
+                return score
+        return len(ConditionNode.SELECTIVITY_ORDER)
+
+    @staticmethod
+    def _absorb_or_leaves(children: List['ConditionNode']) -> List['ConditionNode']:
+        """
+        Drop OR leaf children whose matches are a subset of another leaf's.
+
+        OR(favorite, favorite AND Apple) is just favorite: the narrower leaf
+        can't add assets, so its search is skipped entirely.
+
+        Args:
+            children: Children of the OR node
+
+        Returns:
+            The children that can add assets
+        """
+        kept: List['ConditionNode'] = []
+        for child in children:
+            if child.node_type == ConditionType.LEAF:
+                if any(
+                    other.node_type == ConditionType.LEAF and child.condition.implies(other.condition)
+                    for other in kept
+                ):
+                    logger.debug(f"Dropped OR leaf covered by a sibling: {child.condition}")
+                    continue
+                kept = [
+                    other for other in kept
+                    if other.node_type != ConditionType.LEAF or not other.condition.implies(child.condition)
+                ]
+            kept.append(child)
+        return kept
+
+    @staticmethod
+    def _merge_or_leaves(children: List['ConditionNode']) -> List['ConditionNode']:
+        """
+        Merge OR leaf children that differ only in asset_types into one leaf.
+
+        search_assets matches any of the asset types it is given, so
+        OR(types=[IMAGE], types=[VIDEO]) with otherwise identical filters is a
+        single query for [IMAGE, VIDEO]. No other field can be merged this way:
+        Immich takes one camera make/model, and personIds requires ALL people.
+
+        Args:
+            children: Children of the OR node
+
+        Returns:
+            The children with mergeable leaves combined
+        """
+        groups: Dict[tuple, List['ConditionNode']] = {}
+        for child in children:
+            if child.node_type == ConditionType.LEAF and child.condition.asset_types is not None:
+                shape = replace(child.condition, asset_types=None)._key()
+                groups.setdefault(shape, []).append(child)
+
+        if all(len(group) == 1 for group in groups.values()):
+            return children
+
+        merged_children = []
+        emitted = set()
+        for child in children:
+            if child.node_type != ConditionType.LEAF or child.condition.asset_types is None:
+                merged_children.append(child)
+                continue
+
+            shape = replace(child.condition, asset_types=None)._key()
+            if shape in emitted:
+                continue
+            emitted.add(shape)
+
+            group = groups[shape]
+            if len(group) == 1:
+                merged_children.append(child)
+                continue
+
+            asset_types = list(dict.fromkeys(
+                asset_type for leaf in group for asset_type in leaf.condition.asset_types
+            ))
+            merged = replace(child.condition, asset_types=asset_types)
+            logger.debug(f"Merged {len(group)} OR leaves into single condition: {merged}")
+            merged_children.append(ConditionNode(ConditionType.LEAF, condition=merged))
+
+        return merged_children
+
+    @staticmethod
+    def _combine_and_leaves(children: List['ConditionNode']) -> Optional['ConditionNode']:
         """
         Combine adjacent LEAF nodes in an AND operation into a single API call.
 
+        Args:
+            children: Children of the AND node
+
         Returns:
             Combined LEAF node if all children are compatible, None otherwise
         """
         # Check if all children are LEAF nodes
-        if not all(child.node_type == ConditionType.LEAF for child in self.children):
+        if not all(child.node_type == ConditionType.LEAF for child in children):
             return None
 
         # Check if all leaves can be combined (no conflicting filters)
-        combined_condition = FilterCondition()
+        combined = {}
 
-        for child in self.children:
+        for child in children:
             if not child.condition:
                 continue
 
             cond = child.condition
 
-            # Check for conflicts and combine
+            if cond.is_empty:
+                return ConditionNode(ConditionType.LEAF, condition=EMPTY_CONDITION)
+
+            # Check for conflicts and combine. A field set to two different
+            # values is a contradiction: the AND can never match anything.
             if cond.is_favorite is not None:
-                if combined_condition.is_favorite is not None:
-                    # Conflicting favorites - can't combine
-                    return None
-                combined_condition.is_favorite = cond.is_favorite
+                if combined.get("is_favorite") not in (None, cond.is_favorite):
+                    logger.debug("AND of favorite and non-favorite can never match")
+                    return ConditionNode(ConditionType.LEAF, condition=EMPTY_CONDITION)
+                combined["is_favorite"] = cond.is_favorite
 
             if cond.asset_types is not None:
-                if combined_condition.asset_types is not None:
+                if combined.get("asset_types") is not None:
                     # Intersect asset types
-                    combined_condition.asset_types = list(
-                        set(combined_condition.asset_types) & set(cond.asset_types)
+                    combined["asset_types"] = list(
+                        set(combined["asset_types"]) & set(cond.asset_types)
                     )
-                    if not combined_condition.asset_types:
+                    if not combined["asset_types"]:
                         # Empty intersection - no results possible
-                        return ConditionNode(ConditionType.LEAF, condition=FilterCondition())
+                        return ConditionNode(ConditionType.LEAF, condition=EMPTY_CONDITION)
                 else:
-                    combined_condition.asset_types = cond.asset_types
+                    combined["asset_types"] = cond.asset_types
 
             if cond.camera_make:
-                if combined_condition.camera_make and combined_condition.camera_make != cond.camera_make:
-                    # Conflicting makes - can't combine
-                    return None
-                combined_condition.camera_make = cond.camera_make
+                if combined.get("camera_make") and combined.get("camera_make") != cond.camera_make:
+                    # An asset has a single camera make
+                    logger.debug("AND of different camera makes can never match")
+                    return ConditionNode(ConditionType.LEAF, condition=EMPTY_CONDITION)
+                combined["camera_make"] = cond.camera_make
 
             if cond.camera_model:
-                if combined_condition.camera_model and combined_condition.camera_model != cond.camera_model:
-                    # Conflicting models - can't combine
-                    return None
-                combined_condition.camera_model = cond.camera_model
+                if combined.get("camera_model") and combined.get("camera_model") != cond.camera_model:
+                    # An asset has a single camera model
+                    logger.debug("AND of different camera models can never match")
+                    return ConditionNode(ConditionType.LEAF, condition=EMPTY_CONDITION)
+                combined["camera_model"] = cond.camera_model
+
+            if cond.person_ids is not None and not cond.person_ids:
+                # People filter whose names all failed to resolve
+                return ConditionNode(ConditionType.LEAF, condition=EMPTY_CONDITION)
 
             if cond.person_ids:
-                if combined_condition.person_ids is not None:
+                if combined.get("person_ids") is not None:
                     # Can't combine multiple people filters in single API call
                     # Each people filter needs its own API call for proper OR/AND logic
                     # (API uses AND logic: multiple personIds = ALL people must be present)
                     return None
-                combined_condition.person_ids = cond.person_ids
+                combined["person_ids"] = cond.person_ids
 
         # Successfully combined all conditions
-        logger.debug(f"Combined {len(self.children)} AND leaves into single condition")
-        return ConditionNode(ConditionType.LEAF, condition=combined_condition)
+        logger.debug(f"Combined {len(children)} AND leaves into single condition")
+        return ConditionNode(ConditionType.LEAF, condition=FilterCondition(**combined))
 
     def __repr__(self):
         if self.node_type == ConditionType.LEAF:
@@ -484,6 +930,15 @@ class ConditionNode:
             return f"{self.node_type.value.upper()}({len(self.children)} children)"
 
 
+# Shared condition for subtrees that can never match
+EMPTY_CONDITION = FilterCondition(is_empty=True)
+
+
+# Subtrees parsed by ConditionNode.from_config, keyed by structure. Weak values,
+# so a subtree is dropped once no rule's condition tree uses it any more.
+_INTERNED_NODES: 'weakref.WeakValueDictionary[tuple, ConditionNode]' = weakref.WeakValueDictionary()
+
+
 class ResolutionFilter:
     """
     Client-side resolution filtering with parallel metadata fetching.
@@ -547,13 +1002,18 @@ class ResolutionFilter:
                 logger.warning(f"Failed to fetch metadata for asset {asset_id}: {str(e)}")
                 return None
 
-        # Process in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = [executor.submit(check_single_asset, aid) for aid in asset_id_list]
-            for future in futures:
-                result = future.result()
-                if result:
-                    matching_assets.add(result)
+        workers = min(self.max_workers, len(asset_id_list))
+        if workers <= 1:
+            # Nothing to overlap, so skip starting a pool
+            results = map(check_single_asset, asset_id_list)
+        else:
+            # Process in parallel
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(check_single_asset, asset_id_list))
+
+        for result in results:
+            if result:
+                matching_assets.add(result)
 
         logger.info(f"Resolution filter matched {len(matching_assets)} assets")
         return matching_assets
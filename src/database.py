@@ -320,6 +320,43 @@ class Database:
 
         return {row["asset_id"]: row["match_type"] for row in cursor.fetchall()}
 
+    def get_match_types_for_assets(
+        self,
+        rule_id: str,
+        album_id: str,
+        asset_ids: Set[str],
+        chunk_size: int = 500
+    ) -> Dict[str, str]:
+        """
+        Get the recorded assets of a rule's album, limited to the given assets.
+
+        Unlike get_album_assets_for_rule(), only rows for asset_ids are read,
+        so checking a rule's current matches doesn't load its whole history.
+
+        Args:
+            rule_id: ID of the rule
+            album_id: ID of the album
+            asset_ids: Asset IDs to look up
+            chunk_size: Maximum asset IDs per query (keeps under SQLite's variable limit)
+
+        Returns:
+            Dict mapping asset_id → match_type for the asset_ids that are recorded
+        """
+        cursor = self.conn.cursor()
+        asset_id_list = list(asset_ids)
+        match_types = {}
+
+        for i in range(0, len(asset_id_list), chunk_size):
+            chunk = asset_id_list[i:i + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT asset_id, match_type FROM album_memberships
+                WHERE rule_id = ? AND album_id = ? AND asset_id IN ({placeholders})
+            """, (rule_id, album_id, *chunk))
+            match_types.update((row["asset_id"], row["match_type"]) for row in cursor.fetchall())
+
+        return match_types
+
     def remove_album_memberships(
         self,
         rule_id: str,
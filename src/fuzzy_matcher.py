@@ -3,13 +3,14 @@ Fuzzy matching module for finding assets related to exact matches via metadata p
 """
 import logging
 import random
+from bisect import bisect_left, bisect_right
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from math import radians, cos, sin, asin, sqrt
-from typing import Dict, List, Optional, Set
+from math import radians, cos, sin, asin, sqrt, pi
+from typing import ClassVar, Dict, List, Optional, Set
 
-from dateutil.parser import parse as parse_iso8601
+from dateutil.parser import parse as parse_dateutil
 
 from immich_client import ImmichClient
 
@@ -20,10 +21,62 @@ logger = logging.getLogger(__name__)
 MAX_FUZZY_SEEDS = 50  # Maximum number of exact matches to use as seeds
 PARALLEL_WORKERS = 10  # Number of parallel threads for metadata fetching
 
+# Earth radius in meters
+EARTH_RADIUS_METERS = 6371000
 
-@dataclass
+
+def parse_iso8601(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp as sent by the Immich API.
+
+    datetime.fromisoformat() (which accepts a trailing 'Z' from Python 3.11)
+    handles Immich's fixed format in C; dateutil's general parser is only
+    used for anything it rejects.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parse_dateutil(value)
+
+
+def _haversine_a(
+    lat1: float, lon1: float, cos_lat1: float,
+    lat2: float, lon2: float, cos_lat2: float,
+) -> float:
+    """
+    The Haversine term a = sin²(d / 2R) for two points given in radians.
+
+    It grows with the distance d, so comparing it against a precomputed
+    threshold decides "within radius" without the asin/sqrt.
+    """
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    return sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * sin(dlon / 2) ** 2
+
+
+def _haversine_radians(
+    lat1: float, lon1: float, cos_lat1: float,
+    lat2: float, lon2: float, cos_lat2: float,
+) -> float:
+    """
+    Haversine distance in meters between two points given in radians.
+
+    Callers convert each point once (including the cosine of its latitude)
+    and reuse it for every pair they test.
+    """
+    a = _haversine_a(lat1, lon1, cos_lat1, lat2, lon2, cos_lat2)
+    return EARTH_RADIUS_METERS * 2 * asin(sqrt(a))
+
+
+@dataclass(slots=True)
 class AssetMetadata:
-    """Metadata for proximity calculations."""
+    """
+    Metadata for proximity calculations.
+
+    One is kept per exact match and per candidate, so instances use slots
+    instead of a per-instance __dict__.
+    """
     asset_id: str
     timestamp: Optional[datetime]
     latitude: Optional[float]
@@ -33,6 +86,13 @@ class AssetMetadata:
 class FuzzyMatcher:
     """Finds assets related to exact matches via metadata proximity."""
 
+    # Shared by every matcher (one is created per rule), so the worker threads
+    # are started once and reused instead of building a pool per fetch
+    _executor: ClassVar[ThreadPoolExecutor] = ThreadPoolExecutor(
+        max_workers=PARALLEL_WORKERS,
+        thread_name_prefix="fuzzy-metadata",
+    )
+
     def __init__(
         self,
         client: ImmichClient,
@@ -91,8 +151,10 @@ class FuzzyMatcher:
         start_time, end_time = self._calculate_time_boundaries(exact_metadata, rule_date_filters)
         logger.debug(f"Expanded time window: {start_time} to {end_time}")
 
-        # Step 3: Query candidates within time window
+        # Step 3: Query candidates within time window, excluding exact matches
+        # up front so their metadata isn't fetched again
         candidates = self._query_candidates(start_time, end_time, rule_date_filters)
+        candidates.difference_update(exact_match_ids)
         if not candidates:
             logger.info("No candidate assets found in expanded time window")
             return set()
@@ -102,9 +164,6 @@ class FuzzyMatcher:
         # Step 4: Filter by proximity (time + GPS if available)
         fuzzy_matches = self._filter_by_proximity(candidates, exact_metadata)
 
-        # Step 5: Exclude exact matches from fuzzy results
-        fuzzy_matches = fuzzy_matches - exact_match_ids
-
         logger.info(f"Fuzzy matching found {len(fuzzy_matches)} related assets")
         return fuzzy_matches
 
@@ -129,14 +188,13 @@ class FuzzyMatcher:
                 logger.warning(f"Failed to fetch metadata for asset {asset_id}: {str(e)}")
                 return None
 
-        # Fetch in parallel using ThreadPoolExecutor
+        # Fetch in parallel on the shared thread pool
         metadata_list = []
-        with ThreadPoolExecutor(max_workers=PARALLEL_WORKERS) as executor:
-            futures = [executor.submit(fetch_single, aid) for aid in asset_id_list]
-            for future in futures:
-                result = future.result()
-                if result:
-                    metadata_list.append(result)
+        futures = [self._executor.submit(fetch_single, aid) for aid in asset_id_list]
+        for future in futures:
+            result = future.result()
+            if result:
+                metadata_list.append(result)
 
         return metadata_list
 
@@ -304,30 +362,66 @@ class FuzzyMatcher:
         if not candidate_metadata:
             return set()
 
+        # Exact matches with a timestamp, as (timestamp, lat, lon, cos(lat))
+        # with the coordinates converted to radians once for all candidates
+        # (None without GPS). Sorted by time, so each candidate only visits
+        # the anchors inside its time window (found by bisection).
+        anchors = []
+        for exact in exact_metadata:
+            if not exact.timestamp:
+                continue
+            if exact.latitude and exact.longitude:
+                lat = radians(exact.latitude)
+                anchors.append((exact.timestamp, lat, radians(exact.longitude), cos(lat)))
+            else:
+                anchors.append((exact.timestamp, None, None, None))
+        anchors.sort(key=lambda anchor: anchor[0])
+        anchor_times = [anchor[0] for anchor in anchors]
+
+        # Points further apart in latitude alone than this (in radians) are
+        # beyond location_radius, since the great-circle distance is at least
+        # R * |dlat|; such pairs are rejected without any trig
+        max_dlat = self.location_radius / EARTH_RADIUS_METERS
+
+        # Distance <= location_radius exactly when the Haversine term is at
+        # most sin²(max_dlat / 2) (any radius past half the globe matches all)
+        max_a = sin(max_dlat / 2) ** 2 if max_dlat < pi else 1.0
+
         fuzzy_matches = set()
 
         for candidate in candidate_metadata:
             if not candidate.timestamp:
                 continue  # Skip if no timestamp
 
-            # Check if within time_window AND location_radius of ANY exact match
-            for exact in exact_metadata:
-                if not exact.timestamp:
-                    continue
+            # Exact matches within time_window of the candidate
+            lo = bisect_left(anchor_times, candidate.timestamp - self.time_window)
+            hi = bisect_right(anchor_times, candidate.timestamp + self.time_window, lo)
+            if lo == hi:
+                continue  # Too far in time from every exact match
+
+            # Without GPS on the candidate, being close in time is enough
+            if not (candidate.latitude and candidate.longitude):
+                fuzzy_matches.add(candidate.asset_id)
+                continue
+
+            candidate_lat = radians(candidate.latitude)
+            candidate_lon = radians(candidate.longitude)
+            candidate_cos_lat = cos(candidate_lat)
 
-                # Check time proximity
-                time_diff = abs((candidate.timestamp - exact.timestamp).total_seconds())
-                if time_diff > self.time_window.total_seconds():
-                    continue  # Too far in time
+            # Check if within location_radius of ANY exact match in the window
+            for index in range(lo, hi):
+                _, exact_lat, exact_lon, exact_cos_lat = anchors[index]
 
                 # Check GPS proximity (if both have GPS)
-                if candidate.latitude and candidate.longitude and exact.latitude and exact.longitude:
-                    distance = self._haversine_distance(
-                        candidate.latitude, candidate.longitude,
-                        exact.latitude, exact.longitude
-                    )
+                if exact_lat is not None:
+                    if abs(candidate_lat - exact_lat) > max_dlat:
+                        continue  # Too far north/south
 
-                    if distance > self.location_radius:
+                    a = _haversine_a(
+                        candidate_lat, candidate_lon, candidate_cos_lat,
+                        exact_lat, exact_lon, exact_cos_lat
+                    )
+                    if a > max_a:
                         continue  # Too far in distance
 
                 # If we reach here, candidate is within proximity
@@ -356,18 +450,8 @@ class FuzzyMatcher:
         Returns:
             Distance in meters
         """
-        # Earth radius in meters
-        R = 6371000
-
-        # Convert to radians
-        lat1_rad, lon1_rad = radians(lat1), radians(lon1)
-        lat2_rad, lon2_rad = radians(lat2), radians(lon2)
-
-        # Haversine formula
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-
-        a = sin(dlat / 2) ** 2 + cos(lat1_rad) * cos(lat2_rad) * sin(dlon / 2) ** 2
-        c = 2 * asin(sqrt(a))
-
-        return R * c
+        lat1_rad, lat2_rad = radians(lat1), radians(lat2)
+        return _haversine_radians(
+            lat1_rad, radians(lon1), cos(lat1_rad),
+            lat2_rad, radians(lon2), cos(lat2_rad)
+        )
@@ -3,9 +3,17 @@ Immich API client for managing albums and searching assets.
 """
 import logging
 import time
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Decodes the per-asset metadata responses several times faster. Listed in
+    # requirements.txt (so the Docker image has it); json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
@@ -14,6 +22,9 @@ logger = logging.getLogger(__name__)
 class ImmichClient:
     """Client for interacting with Immich API."""
 
+    # Retries per idempotent request on 429/5xx responses and connection errors
+    MAX_RETRIES = 4
+
     def __init__(self, base_url: str, api_key: str):
         """
         Initialize the Immich client.
@@ -29,8 +40,20 @@ class ImmichClient:
             "x-api-key": api_key,
         }
         self.session = requests.Session()
-        # Configure HTTPAdapter with larger connection pool for parallel processing
-        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50)
+        # Configure HTTPAdapter with larger connection pool for parallel processing.
+        # Idempotent requests (GET, PUT, DELETE; not POST) are retried with
+        # exponential backoff on rate limiting and transient server errors,
+        # honouring Retry-After, so one flaky response doesn't fail a whole rule.
+        # The last response is returned as-is when retries run out, so callers'
+        # raise_for_status() still reports the HTTP error.
+        retry = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=retry)
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
         self.session.headers.update(self.headers)
@@ -83,6 +106,9 @@ class ImmichClient:
         url = f"{self.base_url}/assets/{asset_id}"
         response = self.session.get(url)
         response.raise_for_status()
+        # Fetched once per asset during fuzzy matching, so decoding cost adds up
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
 
     def search_assets(
@@ -120,9 +146,7 @@ class ImmichClient:
         Returns:
             Set of asset IDs matching the criteria
         """
-        url = f"{self.base_url}/search/metadata"
         asset_ids = set()
-        page = 1
 
         # Handle asset_types default
         filter_by_type = True
@@ -135,61 +159,120 @@ class ImmichClient:
                 filter_by_type = False
                 asset_types = []  # Empty list for logging only
 
+        filters = {}
+
+        # Add date filters
+        if taken_after:
+            filters["takenAfter"] = taken_after
+        if taken_before:
+            filters["takenBefore"] = taken_before
+        if created_after:
+            filters["createdAfter"] = created_after
+        if created_before:
+            filters["createdBefore"] = created_before
+
+        # Add favorite filter
+        if is_favorite is not None:
+            filters["isFavorite"] = is_favorite
+
+        # Add camera filters
+        if camera_make:
+            filters["make"] = camera_make
+        if camera_model:
+            filters["model"] = camera_model
+
+        # Add people filter
+        # IMPORTANT: Immich API uses AND logic for personIds
+        # Multiple IDs = assets with ALL of those people (not ANY)
+        # Example: personIds: [id1, id2] → returns assets with person1 AND person2
+        # For OR logic (ANY person), use explicit OR conditions which make separate API calls
+        if include_people_ids:
+            filters["personIds"] = include_people_ids
+
+        for assets in self._iter_search_pages(filters, page_size):
+            # Filter by asset types (if specified)
+            for asset in assets:
+                asset_type = asset.get("type", "").upper()
+                if filter_by_type:
+                    if asset_type in asset_types:
+                        asset_ids.add(asset["id"])
+                    else:
+                        logger.debug(f"Skipping asset {asset.get('id')} (type: {asset_type}, wanted: {asset_types})")
+                else:
+                    # No type filtering - include all
+                    asset_ids.add(asset["id"])
+
+        if filter_by_type and asset_types:
+            asset_type_str = ", ".join(asset_types)
+            logger.info(f"Found {len(asset_ids)} assets ({asset_type_str}) matching criteria")
+        else:
+            logger.info(f"Found {len(asset_ids)} assets (all types) matching criteria")
+        return asset_ids
+
+    def search_asset_details(
+        self,
+        asset_types: Optional[List[str]] = None,
+        with_exif: bool = False,
+        page_size: int = 1000,
+    ) -> Dict[str, Dict]:
+        """
+        Search for assets and keep the asset objects the search returns.
+
+        Use this instead of search_assets followed by get_asset_metadata per
+        asset when only the fields in the search results are needed.
+
+        Args:
+            asset_types: List of asset types to include (e.g., ["IMAGE"]).
+                        Pass empty list or None to fetch all types.
+            with_exif: Include exifInfo (dimensions, camera, etc.) in each asset
+            page_size: Number of results per page
+
+        Returns:
+            Dict mapping asset ID to the asset dict from the search results
+        """
+        filters = {"withExif": True} if with_exif else {}
+        wanted_types = set(map(str.upper, asset_types or ()))
+
+        assets_by_id = {}
+        for assets in self._iter_search_pages(filters, page_size):
+            for asset in assets:
+                if not wanted_types or asset.get("type", "").upper() in wanted_types:
+                    assets_by_id[asset["id"]] = asset
+
+        logger.info(f"Found {len(assets_by_id)} assets matching criteria")
+        return assets_by_id
+
+    def _iter_search_pages(self, filters: Dict, page_size: int) -> Iterator[List[Dict]]:
+        """
+        Page through /search/metadata, yielding each page of asset dicts.
+
+        Args:
+            filters: Search filters to send with every page request
+            page_size: Number of results per page
+
+        Yields:
+            List of asset dicts for each non-empty page
+        """
+        url = f"{self.base_url}/search/metadata"
+        page = 1
+
         while True:
             payload = {
                 "page": page,
                 "size": page_size,
+                **filters,
             }
 
-            # Add date filters
-            if taken_after:
-                payload["takenAfter"] = taken_after
-            if taken_before:
-                payload["takenBefore"] = taken_before
-            if created_after:
-                payload["createdAfter"] = created_after
-            if created_before:
-                payload["createdBefore"] = created_before
-
-            # Add favorite filter
-            if is_favorite is not None:
-                payload["isFavorite"] = is_favorite
-
-            # Add camera filters
-            if camera_make:
-                payload["make"] = camera_make
-            if camera_model:
-                payload["model"] = camera_model
-
-            # Add people filter
-            # IMPORTANT: Immich API uses AND logic for personIds
-            # Multiple IDs = assets with ALL of those people (not ANY)
-            # Example: personIds: [id1, id2] → returns assets with person1 AND person2
-            # For OR logic (ANY person), use explicit OR conditions which make separate API calls
-            if include_people_ids:
-                payload["personIds"] = include_people_ids
-
             logger.debug(f"Searching assets: page {page}, payload: {payload}")
             response = self.session.post(url, json=payload)
             response.raise_for_status()
             data = response.json()
 
-            # Extract asset IDs from the response
+            # Extract assets from the response
             assets = data.get("assets", {}).get("items", [])
             if not assets:
                 break
-
-            # Filter by asset types (if specified)
-            for asset in assets:
-                asset_type = asset.get("type", "").upper()
-                if filter_by_type:
-                    if asset_type in asset_types:
-                        asset_ids.add(asset["id"])
-                    else:
-                        logger.debug(f"Skipping asset {asset.get('id')} (type: {asset_type}, wanted: {asset_types})")
-                else:
-                    # No type filtering - include all
-                    asset_ids.add(asset["id"])
+            yield assets
 
             # Check if there are more pages
             next_page = data.get("assets", {}).get("nextPage")
@@ -201,13 +284,6 @@ class ImmichClient:
             page = int(next_page)
             time.sleep(0.1)  # Be nice to the API
 
-        if filter_by_type and asset_types:
-            asset_type_str = ", ".join(asset_types)
-            logger.info(f"Found {len(asset_ids)} assets ({asset_type_str}) matching criteria")
-        else:
-            logger.info(f"Found {len(asset_ids)} assets (all types) matching criteria")
-        return asset_ids
-
     def list_albums(self) -> List[Dict]:
         """List all albums."""
         url = f"{self.base_url}/albums"
@@ -434,8 +510,4 @@ class ImmichClient:
         response.raise_for_status()
         album_data = response.json()
 
-        asset_ids = set()
-        for asset in album_data.get("assets", []):
-            asset_ids.add(asset["id"])
-
-        return asset_ids
+        return {asset["id"] for asset in album_data.get("assets", [])}
@@ -10,7 +10,7 @@ from pathlib import Path
 
 from immich_client import ImmichClient
 from database import Database
-from rules import RuleEngine, UserResolver, PeopleResolver
+from rules import RuleEngine, UserResolver, PeopleResolver, load_config_file
 
 
 def setup_logging(log_level: str = "INFO"):
@@ -243,14 +243,13 @@ def main():
 
     # Create PeopleResolver before RuleEngine (needed for condition tree building)
     # We need to do a preliminary check to see if any rules use people filtering
-    # by loading the config first
-    import yaml
-    with open(args.config, 'r') as f:
-        temp_config = yaml.safe_load(f)
+    # by loading the config first (the RuleEngine then reuses the loaded config)
+    logger.info(f"Loading configuration from: {args.config}")
+    config = load_config_file(args.config)
 
     needs_people = any(
         _rule_has_people_filter(rule)
-        for rule in temp_config.get("rules", [])
+        for rule in config.get("rules", [])
     )
 
     people_resolver = None
@@ -267,7 +266,8 @@ def main():
     rule_engine = RuleEngine(
         args.config,
         default_timezone=env_config["default_timezone"],
-        people_resolver=people_resolver
+        people_resolver=people_resolver,
+        config=config
     )
 
     try:
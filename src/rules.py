@@ -1,8 +1,10 @@
 """
 Rule parsing and execution for dynamic album management.
 """
+import calendar
+import functools
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional, Set
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
@@ -16,6 +18,41 @@ from conditions import ConditionNode, FilterCondition, ConditionType
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def load_config_file(config_path: str) -> Dict:
+    """
+    Load a YAML configuration file.
+
+    Args:
+        config_path: Path to the YAML configuration file
+
+    Returns:
+        Configuration dict
+    """
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+@functools.lru_cache(maxsize=None)
+def _zoneinfo(tz_name: str) -> ZoneInfo:
+    """Return the ZoneInfo for an IANA name, built once per name per process."""
+    return ZoneInfo(tz_name)
+
+
+def _format_utc(dt: datetime) -> str:
+    """Format a UTC datetime as ISO 8601 with milliseconds and a Z suffix."""
+    # Built from the integer fields rather than strftime, which re-parses the format each call
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.000Z"
+    )
+
 
 class UserResolver:
     """Resolves user identifiers (emails/IDs) to user IDs."""
@@ -101,11 +138,17 @@ class PeopleResolver:
         """
         self.all_people = all_people
         self.name_to_id = {person["name"]: person["id"] for person in all_people}
+        # Resolved IDs per names list; the same people recur across many rules
+        self._resolved: Dict[tuple, Optional[List[str]]] = {}
 
     def resolve_people_names(self, names: List[str]) -> Optional[List[str]]:
         """
         Resolve people names to person IDs.
 
+        Each distinct list of names is resolved (and any missing person
+        warned about) once; later calls return the same list, which callers
+        must not modify.
+
         Args:
             names: List of person names
 
@@ -115,6 +158,10 @@ class PeopleResolver:
         if not names:
             return None
 
+        key = tuple(names)
+        if key in self._resolved:
+            return self._resolved[key]
+
         resolved_ids = []
         for name in names:
             if name in self.name_to_id:
@@ -122,16 +169,19 @@ class PeopleResolver:
             else:
                 logger.warning(f"Person '{name}' not found in Immich")
 
-        return resolved_ids if resolved_ids else None
+        result = resolved_ids if resolved_ids else None
+        self._resolved[key] = result
+        return result
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleFilters:
     """
     Represents filters for asset matching.
 
     This class encapsulates all the various filter criteria that can be applied
-    when searching for assets to include in a dynamic album.
+    when searching for assets to include in a dynamic album. One is built per
+    (expanded) rule, so instances use slots instead of a per-instance __dict__.
     """
 
     # Favorite filter
@@ -173,7 +223,7 @@ class RuleFilters:
         if not isinstance(asset_types, list):
             asset_types = [asset_types]
         # Normalize to uppercase
-        asset_types = [t.upper() for t in asset_types]
+        asset_types = list(map(str.upper, asset_types))
 
         # Parse camera filters
         camera = filters_config.get("camera", {})
@@ -313,7 +363,9 @@ class Rule:
                 logger.debug(f"Resolved {len(self.filters.include_people)} people to {len(include_people_ids)} IDs")
                 # Add people to the condition tree's leaf node
                 if self.condition_tree.condition:
-                    self.condition_tree.condition.person_ids = include_people_ids
+                    self.condition_tree.condition = replace(
+                        self.condition_tree.condition, person_ids=include_people_ids
+                    )
 
         # Get base asset set from date-range query (if we have date filters)
         base_assets = None
@@ -342,24 +394,48 @@ class RuleEngine:
 
     def __init__(
         self,
-        config_path: str,
+        config_path: Optional[str],
         default_timezone: str = "America/New_York",
-        people_resolver: Optional['PeopleResolver'] = None
+        people_resolver: Optional['PeopleResolver'] = None,
+        config: Optional[Dict] = None
     ):
         """
         Initialize the rule engine.
 
         Args:
-            config_path: Path to the YAML configuration file
+            config_path: Path to the YAML configuration file (None when config is given)
             default_timezone: Default IANA timezone for recurring rules
             people_resolver: Optional resolver for people names to IDs (needed for conditions)
+            config: Already-loaded configuration dict; the file is not read when given
         """
         self.config_path = config_path
         self.default_timezone = default_timezone
         self.people_resolver = people_resolver
         self.mode = "add_only"
         self.rules: List[Rule] = []
-        self._load_config()
+        if config is None:
+            config = self._read_config()
+        self._load_config(config)
+
+    @classmethod
+    def from_dict(
+        cls,
+        config: Dict,
+        default_timezone: str = "America/New_York",
+        people_resolver: Optional['PeopleResolver'] = None
+    ) -> 'RuleEngine':
+        """
+        Create a rule engine from a configuration dict instead of a YAML file.
+
+        Args:
+            config: Configuration dict (as loaded from YAML)
+            default_timezone: Default IANA timezone for recurring rules
+            people_resolver: Optional resolver for people names to IDs (needed for conditions)
+
+        Returns:
+            RuleEngine with the configuration's rules loaded
+        """
+        return cls(None, default_timezone=default_timezone, people_resolver=people_resolver, config=config)
 
     def _create_local_midnight_utc(
         self, year: int, month: int, day: int, tz_name: str, duration_days: int
@@ -391,7 +467,7 @@ class RuleEngine:
             - UTC end: 2025-12-26T05:00:00.000Z
         """
         # Create timezone object
-        tz = ZoneInfo(tz_name)
+        tz = _zoneinfo(tz_name)
 
         # Create timezone-aware datetime at midnight in the specified timezone
         local_start = datetime(year, month, day, 0, 0, 0, tzinfo=tz)
@@ -404,8 +480,8 @@ class RuleEngine:
         utc_end = local_end.astimezone(timezone.utc)
 
         # Format as ISO 8601 with milliseconds and Z suffix
-        start_str = utc_start.strftime("%Y-%m-%dT%H:%M:%S.000Z")
-        end_str = utc_end.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        start_str = _format_utc(utc_start)
+        end_str = _format_utc(utc_end)
 
         return start_str, end_str
 
@@ -434,8 +510,13 @@ class RuleEngine:
         # Parse month and day
         month, day = map(int, month_day.split("-"))
 
+        leap_day = (month, day) == (2, 29)
+
         # Generate rule for each year
         for year in range(year_range[0], year_range[1] + 1):
+            if leap_day and not calendar.isleap(year):
+                logger.debug(f"Skipping Feb 29 for {base_id} in non-leap year {year}")
+                continue
             try:
                 # Create timezone-aware start/end datetimes converted to UTC
                 start_str, end_str = self._create_local_midnight_utc(
@@ -462,20 +543,25 @@ class RuleEngine:
                 expanded_rules.append(expanded_rule)
                 logger.debug(f"Expanded recurring rule {base_id} for year {year}")
             except ValueError as e:
-                # Skip invalid dates (e.g., Feb 29 in non-leap years)
+                # Skip any other invalid dates
                 logger.debug(f"Skipping invalid date for {base_id} year {year}: {e}")
                 continue
 
         logger.info(f"Expanded recurring rule '{base_id}' into {len(expanded_rules)} year-specific rules")
         return expanded_rules
 
-    def _load_config(self):
-        """Load configuration from YAML file."""
+    def _read_config(self) -> Dict:
+        """Read the configuration from the YAML file."""
         logger.info(f"Loading configuration from: {self.config_path}")
+        return load_config_file(self.config_path)
 
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
+    def _load_config(self, config: Dict):
+        """
+        Validate a configuration and create its rules.
 
+        Args:
+            config: Configuration dict (as loaded from YAML)
+        """
         # Validate configuration before processing
         try:
             validate_config(config)
@@ -690,8 +776,10 @@ class RuleEngine:
         if self.mode == "add_only":
             # Add-only mode: just add new assets
             if album_id:
-                # Get assets we've already added (Dict[asset_id -> match_type])
-                known_assets = db.get_album_assets_for_rule(rule.id, album_id)
+                # Get which of the matched assets we've already added
+                # (Dict[asset_id -> match_type]); nothing is removed in this
+                # mode, so the rest of the album's history isn't needed
+                known_assets = db.get_match_types_for_assets(rule.id, album_id, all_asset_ids)
                 known_asset_ids = set(known_assets.keys())
 
                 # Split new additions by type
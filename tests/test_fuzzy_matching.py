@@ -1,16 +1,17 @@
 """
 Unit tests for fuzzy matching functionality.
 """
+import random
 import pytest
-from datetime import datetime, timedelta
-from unittest.mock import Mock, MagicMock, patch
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
 import sys
 import os
 
 # Add src to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from fuzzy_matcher import FuzzyMatcher, AssetMetadata
+from fuzzy_matcher import FuzzyMatcher, AssetMetadata, parse_iso8601
 from database import Database
 
 
@@ -126,8 +127,8 @@ class TestFuzzyMatcher:
         # End should be clamped to rule end if it would go later
         assert end <= rule_end
 
-    @patch('fuzzy_matcher.ThreadPoolExecutor')
-    def test_fetch_asset_metadata_success(self, mock_executor_class):
+    @patch.object(FuzzyMatcher, '_executor')
+    def test_fetch_asset_metadata_success(self, mock_executor):
         """Test successful metadata fetching."""
         mock_client = Mock()
         fuzzy_matcher = FuzzyMatcher(mock_client)
@@ -142,10 +143,7 @@ class TestFuzzyMatcher:
             }
         }
 
-        # Mock ThreadPoolExecutor
-        mock_executor = MagicMock()
-        mock_executor_class.return_value.__enter__.return_value = mock_executor
-
+        # Mock the shared executor
         mock_future = Mock()
         mock_future.result.return_value = AssetMetadata(
             'asset1',
@@ -204,6 +202,11 @@ class TestFuzzyMatcher:
         # Should use fileCreatedAt
         assert metadata.timestamp.minute == 35
 
+    def test_parse_iso8601(self):
+        """Test Immich timestamps parse to aware datetimes, with a fallback for other formats."""
+        assert parse_iso8601('2025-06-15T14:30:00.000Z') == datetime(2025, 6, 15, 14, 30, tzinfo=timezone.utc)
+        assert parse_iso8601('June 15 2025 14:30') == datetime(2025, 6, 15, 14, 30)
+
     def test_extract_metadata_no_gps(self):
         """Test metadata extraction with no GPS coordinates."""
         mock_client = Mock()
@@ -224,6 +227,81 @@ class TestFuzzyMatcher:
         assert metadata.latitude is None
         assert metadata.longitude is None
 
+    def test_filter_by_proximity(self):
+        """Test candidates must be near an exact match in time, and in space when both have GPS."""
+        mock_client = Mock()
+        fuzzy_matcher = FuzzyMatcher(mock_client, time_window_minutes=60, location_radius_meters=100)
+
+        exact_metadata = [
+            AssetMetadata("exact1", datetime(2025, 6, 15, 14, 0), 40.7128, -74.0060),
+            AssetMetadata("exact2", None, 40.7128, -74.0060),
+        ]
+        candidate_metadata = [
+            AssetMetadata("near", datetime(2025, 6, 15, 14, 30), 40.7132, -74.0060),
+            AssetMetadata("far_away", datetime(2025, 6, 15, 14, 30), 34.0522, -118.2437),
+            AssetMetadata("no_gps", datetime(2025, 6, 15, 13, 15), None, None),
+            AssetMetadata("too_late", datetime(2025, 6, 15, 15, 30), 40.7128, -74.0060),
+        ]
+
+        with patch.object(fuzzy_matcher, '_fetch_asset_metadata', return_value=candidate_metadata):
+            result = fuzzy_matcher._filter_by_proximity({"candidates"}, exact_metadata)
+
+        assert result == {"near", "no_gps"}
+
+    def test_filter_by_proximity_matches_pairwise_check(self):
+        """Test the time-sorted lookup agrees with checking every candidate/exact pair."""
+        mock_client = Mock()
+        fuzzy_matcher = FuzzyMatcher(mock_client, time_window_minutes=30, location_radius_meters=500)
+        rng = random.Random(42)
+        base = datetime(2025, 6, 15)
+
+        def random_metadata(prefix, count):
+            metadata = []
+            for i in range(count):
+                has_gps = rng.random() < 0.7
+                metadata.append(AssetMetadata(
+                    f"{prefix}{i}",
+                    base + timedelta(minutes=rng.randint(0, 24 * 60)),
+                    40.7 + rng.uniform(-0.01, 0.01) if has_gps else None,
+                    -74.0 + rng.uniform(-0.01, 0.01) if has_gps else None,
+                ))
+            return metadata
+
+        exact_metadata = random_metadata("exact", 50)
+        candidate_metadata = random_metadata("candidate", 500)
+
+        expected = set()
+        for candidate in candidate_metadata:
+            for exact in exact_metadata:
+                if abs(candidate.timestamp - exact.timestamp) > fuzzy_matcher.time_window:
+                    continue
+                if candidate.latitude and exact.latitude and fuzzy_matcher._haversine_distance(
+                    candidate.latitude, candidate.longitude, exact.latitude, exact.longitude
+                ) > fuzzy_matcher.location_radius:
+                    continue
+                expected.add(candidate.asset_id)
+                break
+
+        with patch.object(fuzzy_matcher, '_fetch_asset_metadata', return_value=candidate_metadata):
+            result = fuzzy_matcher._filter_by_proximity({"candidates"}, exact_metadata)
+
+        assert expected
+        assert result == expected
+
+    def test_find_related_assets_skips_exact_match_candidates(self):
+        """Test exact matches are dropped from the candidates before their metadata is fetched."""
+        mock_client = Mock()
+        mock_client.search_assets.return_value = {'exact1', 'exact2', 'candidate1'}
+        fuzzy_matcher = FuzzyMatcher(mock_client)
+
+        exact_metadata = [AssetMetadata('exact1', datetime(2025, 6, 15, 14, 0), None, None)]
+        with patch.object(fuzzy_matcher, '_fetch_asset_metadata', return_value=exact_metadata), \
+                patch.object(fuzzy_matcher, '_filter_by_proximity', return_value={'candidate1'}) as mock_filter:
+            result = fuzzy_matcher.find_related_assets({'exact1', 'exact2'}, {})
+
+        assert result == {'candidate1'}
+        assert mock_filter.call_args.args[0] == {'candidate1'}
+
     def test_find_related_assets_empty_exact_matches(self):
         """Test fuzzy matching with no exact matches."""
         mock_client = Mock()
@@ -325,6 +403,24 @@ class TestDatabaseMigration:
 
         db.close()
 
+    def test_get_match_types_for_assets(self, tmp_path):
+        """Test looking up only the given assets, across query chunks."""
+        db_path = tmp_path / "test.db"
+        db = Database(str(db_path))
+
+        db.record_album_membership('rule1', 'album1', 'Album 1', {'asset1', 'asset2'}, match_type='exact')
+        db.record_album_membership('rule1', 'album1', 'Album 1', {'asset3'}, match_type='fuzzy')
+        db.record_album_membership('rule2', 'album1', 'Album 1', {'asset4'}, match_type='exact')
+
+        assets = db.get_match_types_for_assets(
+            'rule1', 'album1', {'asset1', 'asset3', 'asset4', 'missing'}, chunk_size=2
+        )
+
+        assert assets == {'asset1': 'exact', 'asset3': 'fuzzy'}
+        assert db.get_match_types_for_assets('rule1', 'album1', set()) == {}
+
+        db.close()
+
 
 class TestValidation:
     """Tests for fuzzy_match validation."""
@@ -63,3 +63,31 @@ class TestSearchAssetsPagination:
 
         assert asset_ids == {"asset-1"}
         assert client.session.post.call_count == 1
+
+
+class TestSearchAssetDetails:
+    """Test search_asset_details, which keeps the asset objects from the search."""
+
+    def test_pages_are_merged_and_filtered_by_type(self):
+        """Assets from every page are kept by ID, filtered to the requested types."""
+        client = ImmichClient("https://immich.test/api", "test-key")
+        page1 = _make_response(
+            [
+                {"id": "asset-1", "type": "IMAGE", "originalFileName": "a.jpg"},
+                {"id": "asset-2", "type": "VIDEO", "originalFileName": "b.mp4"},
+            ],
+            next_page="2",
+        )
+        page2 = _make_response(
+            [{"id": "asset-3", "type": "IMAGE", "originalFileName": "c.jpg"}],
+            next_page=None,
+        )
+        client.session.post = Mock(side_effect=[page1, page2])
+
+        assets = client.search_asset_details(asset_types=["image"], with_exif=True)
+
+        assert set(assets) == {"asset-1", "asset-3"}
+        assert assets["asset-3"]["originalFileName"] == "c.jpg"
+        payloads = [call.kwargs["json"] for call in client.session.post.call_args_list]
+        assert [payload["page"] for payload in payloads] == [1, 2]
+        assert all(payload["withExif"] is True for payload in payloads)
@@ -13,30 +13,79 @@ or:
 
     python -m pytest tests/test_resolution_filter.py -v
 """
-import sys
-from pathlib import Path
+import re
+from types import MappingProxyType
 from unittest.mock import Mock, MagicMock, patch
 
-# Add src directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
 
 from conditions import FilterCondition, ConditionNode, ConditionType, ResolutionFilter
 from rules import RuleFilters
 from validation import validate_config, ConfigValidationError
 
 
+# Read-only asset metadata served by the mock client: 1080p, 4K and 720p
+_ASSET_METADATA = MappingProxyType({
+    'asset1': {
+        'id': 'asset1',
+        'exifInfo': {'exifImageWidth': 1920, 'exifImageHeight': 1080}
+    },
+    'asset2': {
+        'id': 'asset2',
+        'exifInfo': {'exifImageWidth': 3840, 'exifImageHeight': 2160}
+    },
+    'asset3': {
+        'id': 'asset3',
+        'exifInfo': {'exifImageWidth': 1280, 'exifImageHeight': 720}
+    },
+})
+_ALL_ASSETS = frozenset(_ASSET_METADATA)
+
+
+# Date range shared by every validation config
+_TAKEN_RANGE = {"start": "2025-01-01T00:00:00.000Z", "end": "2025-12-31T23:59:59.999Z"}
+
+
+@pytest.fixture
+def base_config():
+    """A valid single-rule config with empty filters, rebuilt for each test."""
+    return {
+        "mode": "add_only",
+        "rules": [
+            {
+                "id": "test-resolution",
+                "album_name": "Test Album",
+                "taken_range_utc": dict(_TAKEN_RANGE),
+                "filters": {},
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def mock_client():
+    """A fresh Mock client limited to the ImmichClient calls these tests stub."""
+    return Mock(spec=["get_asset_metadata", "search_assets"])
+
+
+@pytest.fixture(scope="class")
+def filter_obj():
+    """One filter per class, for tests that never call its client."""
+    return ResolutionFilter(object())
+
+
 class TestResolutionFilterDataStructures:
     """Test that resolution field is properly added to data structures."""
 
-    def test_filter_condition_has_resolution_field(self):
-        """Test that FilterCondition has resolution field."""
-        condition = FilterCondition()
-        assert hasattr(condition, 'resolution')
-        assert condition.resolution is None
-
-        # Test with resolution data
-        condition = FilterCondition(resolution=[[1920, 1080], [3840, 2160]])
-        assert condition.resolution == [[1920, 1080], [3840, 2160]]
+    @pytest.mark.parametrize("cls,kwargs,expected", [
+        (FilterCondition, {}, None),
+        (FilterCondition, {"resolution": [[1920, 1080], [3840, 2160]]}, [[1920, 1080], [3840, 2160]]),
+        (RuleFilters, {}, None),
+        (RuleFilters, {"resolution": [[1920, 1080]]}, [[1920, 1080]]),
+    ])
+    def test_resolution_field(self, cls, kwargs, expected):
+        """Test that FilterCondition and RuleFilters carry a resolution field."""
+        assert cls(**kwargs).resolution == expected
 
     def test_filter_condition_has_filters_includes_resolution(self):
         """Test that has_filters() returns True when resolution is set."""
@@ -52,16 +101,6 @@ class TestResolutionFilterDataStructures:
         repr_str = repr(condition)
         assert "resolution=2 sizes" in repr_str
 
-    def test_rule_filters_has_resolution_field(self):
-        """Test that RuleFilters has resolution field."""
-        filters = RuleFilters()
-        assert hasattr(filters, 'resolution')
-        assert filters.resolution is None
-
-        # Test with resolution data
-        filters = RuleFilters(resolution=[[1920, 1080]])
-        assert filters.resolution == [[1920, 1080]]
-
 
 class TestResolutionFilterParsing:
     """Test parsing of resolution filters from config."""
@@ -119,210 +158,61 @@ class TestResolutionFilterParsing:
 class TestResolutionFilterValidation:
     """Test validation of resolution filter configuration."""
 
-    def test_valid_resolution_filter(self):
+    def test_valid_resolution_filter(self, base_config):
         """Test that valid resolution filter passes validation."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "test-resolution",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                    "filters": {
-                        "resolution": {
-                            "include": [
-                                [1920, 1080],
-                                [3840, 2160]
-                            ]
-                        }
-                    }
-                }
+        base_config["rules"][0]["filters"]["resolution"] = {
+            "include": [
+                [1920, 1080],
+                [3840, 2160]
             ]
         }
 
         # Should not raise exception
-        result = validate_config(config)
+        result = validate_config(base_config)
         assert result is True
 
-    def test_invalid_resolution_not_dict(self):
-        """Test that resolution not being a dict is caught."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "test-resolution",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                    "filters": {
-                        "resolution": "invalid"
-                    }
-                }
-            ]
-        }
-
-        try:
-            validate_config(config)
-            assert False, "Should have raised ConfigValidationError"
-        except ConfigValidationError as e:
-            assert "filters.resolution must be a dictionary" in str(e)
-
-    def test_invalid_resolution_include_not_list(self):
-        """Test that resolution.include not being a list is caught."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "test-resolution",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                    "filters": {
-                        "resolution": {
-                            "include": "invalid"
-                        }
-                    }
-                }
-            ]
-        }
-
-        try:
-            validate_config(config)
-            assert False, "Should have raised ConfigValidationError"
-        except ConfigValidationError as e:
-            assert "must be a list of [width, height] pairs" in str(e)
-
-    def test_invalid_resolution_pair_not_list(self):
-        """Test that resolution pair not being a list is caught."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "test-resolution",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                    "filters": {
-                        "resolution": {
-                            "include": [
-                                "1920x1080"  # String instead of list
-                            ]
-                        }
-                    }
-                }
-            ]
-        }
-
-        try:
-            validate_config(config)
-            assert False, "Should have raised ConfigValidationError"
-        except ConfigValidationError as e:
-            assert "must be a list [width, height]" in str(e)
-
-    def test_invalid_resolution_pair_wrong_length(self):
-        """Test that resolution pair with wrong length is caught."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "test-resolution",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                    "filters": {
-                        "resolution": {
-                            "include": [
-                                [1920, 1080, 24]  # 3 elements instead of 2
-                            ]
-                        }
-                    }
-                }
-            ]
-        }
-
-        try:
-            validate_config(config)
-            assert False, "Should have raised ConfigValidationError"
-        except ConfigValidationError as e:
-            assert "must have exactly 2 elements" in str(e)
-
-    def test_invalid_resolution_pair_not_positive_integers(self):
-        """Test that resolution pair with non-positive or non-integer values is caught."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "test-resolution",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                    "filters": {
-                        "resolution": {
-                            "include": [
-                                [1920, -1080]  # Negative height
-                            ]
-                        }
-                    }
-                }
-            ]
-        }
-
-        try:
-            validate_config(config)
-            assert False, "Should have raised ConfigValidationError"
-        except ConfigValidationError as e:
-            assert "must contain positive integers" in str(e)
-
-    def test_valid_resolution_in_conditions(self):
+    @pytest.mark.parametrize("resolution,message", [
+        ("invalid", "filters.resolution must be a dictionary"),
+        ({"include": "invalid"}, "must be a list of [width, height] pairs"),
+        # String instead of list
+        ({"include": ["1920x1080"]}, "must be a list [width, height]"),
+        # 3 elements instead of 2
+        ({"include": [[1920, 1080, 24]]}, "must have exactly 2 elements"),
+        # Negative height
+        ({"include": [[1920, -1080]]}, "must contain positive integers"),
+    ], ids=["not-dict", "include-not-list", "pair-not-list", "pair-wrong-length", "pair-not-positive"])
+    def test_invalid_resolution(self, base_config, resolution, message):
+        """Test that each malformed resolution filter is caught with its error."""
+        base_config["rules"][0]["filters"]["resolution"] = resolution
+
+        with pytest.raises(ConfigValidationError, match=re.escape(message)):
+            validate_config(base_config)
+
+    def test_valid_resolution_in_conditions(self, base_config):
         """Test that valid resolution in conditions format passes validation."""
-        config = {
-            "mode": "add_only",
-            "rules": [
+        rule = base_config["rules"][0]
+        del rule["filters"]
+        rule["conditions"] = {
+            "and": [
+                {"is_favorite": True},
                 {
-                    "id": "test-resolution",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                    "conditions": {
-                        "and": [
-                            {"is_favorite": True},
-                            {
-                                "resolution": {
-                                    "include": [[1920, 1080]]
-                                }
-                            }
-                        ]
+                    "resolution": {
+                        "include": [[1920, 1080]]
                     }
                 }
             ]
         }
 
         # Should not raise exception
-        result = validate_config(config)
+        result = validate_config(base_config)
         assert result is True
 
 
 class TestResolutionFilterClass:
     """Test the ResolutionFilter helper class."""
 
-    def test_resolution_filter_initialization(self):
+    def test_resolution_filter_initialization(self, mock_client):
         """Test ResolutionFilter initialization."""
-        mock_client = Mock()
         filter_obj = ResolutionFilter(mock_client)
 
         assert filter_obj.client == mock_client
@@ -332,11 +222,8 @@ class TestResolutionFilterClass:
         filter_obj = ResolutionFilter(mock_client, max_workers=5)
         assert filter_obj.max_workers == 5
 
-    def test_extract_resolution_from_exif(self):
+    def test_extract_resolution_from_exif(self, filter_obj):
         """Test resolution extraction from EXIF data."""
-        mock_client = Mock()
-        filter_obj = ResolutionFilter(mock_client)
-
         asset = {
             'id': 'asset1',
             'exifInfo': {
@@ -348,11 +235,8 @@ class TestResolutionFilterClass:
         resolution = filter_obj._extract_resolution(asset)
         assert resolution == (1920, 1080)
 
-    def test_extract_resolution_from_original(self):
+    def test_extract_resolution_from_original(self, filter_obj):
         """Test resolution extraction from original dimensions (fallback)."""
-        mock_client = Mock()
-        filter_obj = ResolutionFilter(mock_client)
-
         asset = {
             'id': 'asset1',
             'exifInfo': {},  # No EXIF data
@@ -363,11 +247,8 @@ class TestResolutionFilterClass:
         resolution = filter_obj._extract_resolution(asset)
         assert resolution == (3840, 2160)
 
-    def test_extract_resolution_prioritizes_exif(self):
+    def test_extract_resolution_prioritizes_exif(self, filter_obj):
         """Test that EXIF data is prioritized over original dimensions."""
-        mock_client = Mock()
-        filter_obj = ResolutionFilter(mock_client)
-
         asset = {
             'id': 'asset1',
             'exifInfo': {
@@ -381,11 +262,8 @@ class TestResolutionFilterClass:
         resolution = filter_obj._extract_resolution(asset)
         assert resolution == (1920, 1080)  # EXIF takes priority
 
-    def test_extract_resolution_returns_none_when_unavailable(self):
+    def test_extract_resolution_returns_none_when_unavailable(self, filter_obj):
         """Test that None is returned when no resolution data is available."""
-        mock_client = Mock()
-        filter_obj = ResolutionFilter(mock_client)
-
         asset = {
             'id': 'asset1',
             'exifInfo': {}
@@ -394,11 +272,8 @@ class TestResolutionFilterClass:
         resolution = filter_obj._extract_resolution(asset)
         assert resolution is None
 
-    def test_filter_by_resolution_empty_inputs(self):
+    def test_filter_by_resolution_empty_inputs(self, filter_obj):
         """Test that empty inputs return empty set."""
-        mock_client = Mock()
-        filter_obj = ResolutionFilter(mock_client)
-
         # Empty asset IDs
         result = filter_obj.filter_by_resolution(set(), [[1920, 1080]])
         assert result == set()
@@ -407,31 +282,13 @@ class TestResolutionFilterClass:
         result = filter_obj.filter_by_resolution({'asset1'}, [])
         assert result == set()
 
-    def test_filter_by_resolution_matching(self):
+    def test_filter_by_resolution_matching(self, mock_client):
         """Test filtering assets by resolution."""
-        mock_client = Mock()
 
         # Mock metadata responses
-        def mock_get_metadata(asset_id):
-            metadata = {
-                'asset1': {
-                    'id': 'asset1',
-                    'exifInfo': {'exifImageWidth': 1920, 'exifImageHeight': 1080}
-                },
-                'asset2': {
-                    'id': 'asset2',
-                    'exifInfo': {'exifImageWidth': 3840, 'exifImageHeight': 2160}
-                },
-                'asset3': {
-                    'id': 'asset3',
-                    'exifInfo': {'exifImageWidth': 1280, 'exifImageHeight': 720}
-                }
-            }
-            return metadata.get(asset_id, {})
+        mock_client.get_asset_metadata.side_effect = _ASSET_METADATA.get
 
-        mock_client.get_asset_metadata = mock_get_metadata
-
-        filter_obj = ResolutionFilter(mock_client)
+        filter_obj = ResolutionFilter(mock_client, max_workers=1)
 
         # Filter for 1920x1080 and 3840x2160
         asset_ids = {'asset1', 'asset2', 'asset3'}
@@ -445,9 +302,8 @@ class TestResolutionFilterClass:
         assert 'asset2' in result
         assert 'asset3' not in result
 
-    def test_filter_by_resolution_handles_exceptions(self):
+    def test_filter_by_resolution_handles_exceptions(self, mock_client):
         """Test that exceptions during metadata fetch are handled gracefully."""
-        mock_client = Mock()
 
         def mock_get_metadata(asset_id):
             if asset_id == 'asset_error':
@@ -457,9 +313,9 @@ class TestResolutionFilterClass:
                 'exifInfo': {'exifImageWidth': 1920, 'exifImageHeight': 1080}
             }
 
-        mock_client.get_asset_metadata = mock_get_metadata
+        mock_client.get_asset_metadata.side_effect = mock_get_metadata
 
-        filter_obj = ResolutionFilter(mock_client)
+        filter_obj = ResolutionFilter(mock_client, max_workers=1)
 
         asset_ids = {'asset1', 'asset_error'}
         target_resolutions = [[1920, 1080]]
@@ -470,36 +326,29 @@ class TestResolutionFilterClass:
         assert 'asset1' in result
         assert 'asset_error' not in result
 
+    def test_filter_by_resolution_single_worker_runs_inline(self, mock_client):
+        """Test that a single worker checks assets without starting a thread pool."""
+        mock_client.get_asset_metadata.side_effect = _ASSET_METADATA.get
+        filter_obj = ResolutionFilter(mock_client, max_workers=1)
+
+        with patch('concurrent.futures.ThreadPoolExecutor') as mock_executor:
+            result = filter_obj.filter_by_resolution({'asset1', 'asset3'}, [[1920, 1080]])
+
+        assert result == {'asset1'}
+        mock_executor.assert_not_called()
+
 
 class TestResolutionFilterIntegration:
     """Test integration of resolution filtering with condition evaluation."""
 
-    def test_resolution_filter_in_leaf_evaluation(self):
+    def test_resolution_filter_in_leaf_evaluation(self, mock_client):
         """Test that resolution filter is applied during leaf evaluation."""
-        mock_client = Mock()
 
         # Mock search_assets to return some asset IDs
-        mock_client.search_assets = Mock(return_value={'asset1', 'asset2', 'asset3'})
+        mock_client.search_assets.return_value = _ALL_ASSETS
 
         # Mock metadata for resolution filtering
-        def mock_get_metadata(asset_id):
-            metadata = {
-                'asset1': {
-                    'id': 'asset1',
-                    'exifInfo': {'exifImageWidth': 1920, 'exifImageHeight': 1080}
-                },
-                'asset2': {
-                    'id': 'asset2',
-                    'exifInfo': {'exifImageWidth': 3840, 'exifImageHeight': 2160}
-                },
-                'asset3': {
-                    'id': 'asset3',
-                    'exifInfo': {'exifImageWidth': 1280, 'exifImageHeight': 720}
-                }
-            }
-            return metadata.get(asset_id, {})
-
-        mock_client.get_asset_metadata = mock_get_metadata
+        mock_client.get_asset_metadata.side_effect = _ASSET_METADATA.get
 
         # Create condition with resolution filter
         condition = FilterCondition(
@@ -546,46 +395,21 @@ class TestResolutionFilterIntegration:
 class TestResolutionFilterBackwardCompatibility:
     """Test that resolution filter doesn't break existing functionality."""
 
-    def test_filters_without_resolution_still_work(self):
+    def test_filters_without_resolution_still_work(self, base_config):
         """Test that rules without resolution filter work as before."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "test-no-resolution",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                    "filters": {
-                        "is_favorite": True,
-                        "asset_types": ["IMAGE"]
-                    }
-                }
-            ]
+        base_config["rules"][0]["filters"] = {
+            "is_favorite": True,
+            "asset_types": ["IMAGE"]
         }
 
         # Should not raise exception
-        result = validate_config(config)
+        result = validate_config(base_config)
         assert result is True
 
-    def test_empty_filters_still_work(self):
+    def test_empty_filters_still_work(self, base_config):
         """Test that rules with empty filters work as before."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "test-empty-filters",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    }
-                }
-            ]
-        }
+        del base_config["rules"][0]["filters"]
 
         # Should not raise exception
-        result = validate_config(config)
+        result = validate_config(base_config)
         assert result is True
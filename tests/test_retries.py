@@ -0,0 +1,88 @@
+"""
+Tests for retrying transient Immich API errors.
+
+To run these tests:
+
+    pytest tests/test_retries.py -v
+"""
+import json
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from immich_client import ImmichClient
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """Answers 429 (with Retry-After: 0) for the first `failures` requests, then 200."""
+
+    failures = 0
+    calls = 0
+
+    def do_GET(self):
+        type(self).calls += 1
+        if type(self).calls <= type(self).failures:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = json.dumps({"id": "asset-1", "exifInfo": {}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Local HTTP server running _FlakyHandler on a free port."""
+    _FlakyHandler.calls = 0
+    # Plain TCPServer: HTTPServer's bind does a reverse DNS lookup of the host
+    httpd = socketserver.TCPServer(("127.0.0.1", 0), _FlakyHandler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _make_client(server):
+    """Client pointed at the local server, without backoff sleeps between retries."""
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api"
+    client = ImmichClient(base_url, "test-key")
+    client.session.get_adapter(base_url).max_retries.backoff_factor = 0
+    return client
+
+
+class TestRetries:
+    """Test that idempotent requests survive rate limiting."""
+
+    def test_rate_limited_request_is_retried(self, server):
+        """A 429 followed by a 200 returns the successful response."""
+        _FlakyHandler.failures = 1
+        client = _make_client(server)
+
+        asset = client.get_asset_metadata("asset-1")
+
+        assert asset["id"] == "asset-1"
+        assert _FlakyHandler.calls == 2
+
+    def test_persistent_errors_raise_http_error(self, server):
+        """Once retries run out the HTTP error is raised as before."""
+        _FlakyHandler.failures = ImmichClient.MAX_RETRIES + 1
+        client = _make_client(server)
+
+        with pytest.raises(requests.HTTPError) as excinfo:
+            client.get_asset_metadata("asset-1")
+
+        assert excinfo.value.response.status_code == 429
+        assert _FlakyHandler.calls == ImmichClient.MAX_RETRIES + 1
@@ -10,11 +10,7 @@ or:
 
     python -m pytest tests/test_validation_and_filtering.py -v
 """
-import sys
-from pathlib import Path
-
-# Add src directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
 
 from validation import (
     ConfigValidator,
@@ -26,238 +22,204 @@ from validation import (
 from rules import RuleFilters
 
 
+@pytest.fixture
+def base_config():
+    """A valid single-rule config, rebuilt for each test."""
+    return {
+        "mode": "add_only",
+        "rules": [
+            {
+                "id": "test-rule",
+                "album_name": "Test Album",
+                "taken_range_utc": {
+                    "start": "2025-01-01T00:00:00.000Z",
+                    "end": "2025-12-31T23:59:59.999Z",
+                },
+            }
+        ],
+    }
+
+
 class TestConfigValidation:
     """Test configuration validation."""
 
-    def test_valid_basic_config(self):
+    def test_valid_basic_config(self, base_config):
         """Test that a basic valid config passes validation."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "test-rule",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                }
-            ],
-        }
-
         # Should not raise an exception
-        result = validate_config(config)
+        result = validate_config(base_config)
         assert result is True
 
-    def test_valid_config_with_filters(self):
+    def test_valid_config_with_filters(self, base_config):
         """Test that a config with new filters passes validation."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "favorites",
-                    "album_name": "My Favorites",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                    "filters": {
-                        "is_favorite": True,
-                        "asset_types": ["IMAGE", "VIDEO"],
-                        "camera": {"make": "Apple", "model": "iPhone 15 Pro"},
-                        "tags": {"include": ["family"], "exclude": ["screenshot"]},
-                    },
-                }
-            ],
+        base_config["rules"][0]["filters"] = {
+            "is_favorite": True,
+            "asset_types": ["IMAGE", "VIDEO"],
+            "camera": {"make": "Apple", "model": "iPhone 15 Pro"},
+            "tags": {"include": ["family"], "exclude": ["screenshot"]},
         }
 
         # Should not raise an exception
-        result = validate_config(config)
+        result = validate_config(base_config)
         assert result is True
 
-    def test_invalid_mode(self):
+    def test_invalid_mode(self, base_config):
         """Test that an invalid mode is caught."""
-        config = {
-            "mode": "invalid_mode",
-            "rules": [
-                {
-                    "id": "test-rule",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                }
-            ],
-        }
+        base_config["mode"] = "invalid_mode"
 
-        try:
-            validate_config(config)
-            assert False, "Should have raised ConfigValidationError"
-        except ConfigValidationError as e:
-            assert "Invalid mode" in str(e)
-            assert "add_only" in str(e)
-            assert "sync" in str(e)
+        with pytest.raises(ConfigValidationError, match=r"Invalid mode 'invalid_mode'\. Must be one of: add_only, sync"):
+            validate_config(base_config)
 
-    def test_missing_required_fields(self):
+    def test_missing_required_fields(self, base_config):
         """Test that missing required fields are caught."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    # Missing 'id' and 'album_name'
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                }
-            ],
-        }
+        rule = base_config["rules"][0]
+        del rule["id"]
+        del rule["album_name"]
 
-        try:
-            validate_config(config)
-            assert False, "Should have raised ConfigValidationError"
-        except ConfigValidationError as e:
-            assert "Missing required field" in str(e)
+        with pytest.raises(ConfigValidationError, match="Missing required field"):
+            validate_config(base_config)
 
-    def test_duplicate_rule_ids(self):
+    def test_duplicate_rule_ids(self, base_config):
         """Test that duplicate rule IDs are caught."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "duplicate-id",
-                    "album_name": "First Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                },
-                {
-                    "id": "duplicate-id",  # Same ID!
-                    "album_name": "Second Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                },
-            ],
+        rules = base_config["rules"]
+        # Same ID, different album
+        rules.append({**rules[0], "album_name": "Second Album"})
+
+        with pytest.raises(ConfigValidationError, match="Duplicate rule ID 'test-rule'"):
+            validate_config(base_config)
+
+    def test_duplicate_rule_ids_reported_once(self):
+        """Test that an ID used by several rules produces a single error."""
+        rule = {
+            "id": "duplicate-id",
+            "album_name": "Album",
+            "taken_range_utc": {
+                "start": "2025-01-01T00:00:00.000Z",
+                "end": "2025-12-31T23:59:59.999Z",
+            },
         }
+        validator = ConfigValidator({"mode": "add_only", "rules": [dict(rule), dict(rule), dict(rule)]})
+
+        with pytest.raises(ConfigValidationError):
+            validator.validate()
+
+        duplicate_errors = [e for e in validator.errors if "Duplicate rule ID" in e]
+        assert len(duplicate_errors) == 1
+        assert "used by 3 rules" in duplicate_errors[0]
+
+    @pytest.mark.parametrize("invalid_date", [
+        "2025-01-01",  # Missing time
+        "2025-01-01 00:00:00",  # Space instead of T
+        "2025-01-01T00:00:00",  # Missing timezone
+        "01/01/2025",  # Wrong format
+        "2025-13-01T00:00:00.000Z",  # Invalid month
+        "2025-02-31T00:00:00.000Z",  # Invalid day
+    ])
+    def test_invalid_date_format(self, base_config, invalid_date):
+        """Test that invalid date formats are caught."""
+        base_config["rules"][0]["taken_range_utc"]["start"] = invalid_date
+
+        with pytest.raises(ConfigValidationError, match="ISO 8601|Invalid date"):
+            validate_config(base_config)
+
+    @pytest.mark.parametrize("valid_date", [
+        "2025-01-01T00:00:00.000Z",  # UTC with milliseconds
+        "2025-01-01T00:00:00Z",  # UTC without milliseconds
+        "2025-01-01T12:00:00+05:30",  # With timezone offset
+        "2025-01-01T12:00:00-08:00",  # Negative offset
+    ])
+    def test_valid_date_formats(self, base_config, valid_date):
+        """Test that various valid date formats are accepted."""
+        base_config["rules"][0]["taken_range_utc"]["start"] = valid_date
 
-        try:
-            validate_config(config)
-            assert False, "Should have raised ConfigValidationError"
-        except ConfigValidationError as e:
-            assert "Duplicate rule ID" in str(e)
-            assert "duplicate-id" in str(e)
+        # Should not raise an exception
+        result = validate_config(base_config)
+        assert result is True
 
-    def test_invalid_date_format(self):
-        """Test that invalid date formats are caught."""
-        invalid_dates = [
-            "2025-01-01",  # Missing time
-            "2025-01-01 00:00:00",  # Space instead of T
-            "2025-01-01T00:00:00",  # Missing timezone
-            "01/01/2025",  # Wrong format
-            "2025-13-01T00:00:00.000Z",  # Invalid month
-            "2025-02-31T00:00:00.000Z",  # Invalid day
-        ]
-
-        for invalid_date in invalid_dates:
-            config = {
-                "mode": "add_only",
-                "rules": [
-                    {
-                        "id": "test-rule",
-                        "album_name": "Test Album",
-                        "taken_range_utc": {
-                            "start": invalid_date,
-                            "end": "2025-12-31T23:59:59.999Z",
-                        },
-                    }
-                ],
-            }
+    def test_start_after_end_date(self, base_config):
+        """Test that start date after end date is caught."""
+        base_config["rules"][0]["taken_range_utc"] = {
+            "start": "2025-12-31T23:59:59.999Z",
+            "end": "2025-01-01T00:00:00.000Z",  # End before start!
+        }
 
-            try:
-                validate_config(config)
-                assert False, f"Should have caught invalid date: {invalid_date}"
-            except ConfigValidationError as e:
-                assert "ISO 8601" in str(e) or "Invalid date" in str(e)
+        with pytest.raises(ConfigValidationError, match="start date must be before end date"):
+            validate_config(base_config)
 
-    def test_valid_date_formats(self):
-        """Test that various valid date formats are accepted."""
-        valid_dates = [
-            "2025-01-01T00:00:00.000Z",  # UTC with milliseconds
-            "2025-01-01T00:00:00Z",  # UTC without milliseconds
-            "2025-01-01T12:00:00+05:30",  # With timezone offset
-            "2025-01-01T12:00:00-08:00",  # Negative offset
-        ]
-
-        for valid_date in valid_dates:
-            config = {
-                "mode": "add_only",
-                "rules": [
-                    {
-                        "id": f"test-rule-{valid_date[:10]}",
-                        "album_name": "Test Album",
-                        "taken_range_utc": {
-                            "start": valid_date,
-                            "end": "2025-12-31T23:59:59.999Z",
-                        },
-                    }
-                ],
-            }
+    def test_invalid_asset_types(self, base_config):
+        """Test that invalid asset types are caught."""
+        base_config["rules"][0]["filters"] = {
+            "asset_types": ["INVALID_TYPE"],
+        }
 
-            # Should not raise an exception
-            result = validate_config(config)
-            assert result is True
+        with pytest.raises(ConfigValidationError, match="Invalid asset_type.*INVALID_TYPE"):
+            validate_config(base_config)
 
-    def test_start_after_end_date(self):
-        """Test that start date after end date is caught."""
-        config = {
+
+class TestRedundantRuleDetection:
+    """Test warnings for rules whose date range is covered by another rule."""
+
+    @staticmethod
+    def _rule(rule_id, album_name, start, end, **extra):
+        rule = {
+            "id": rule_id,
+            "album_name": album_name,
+            "taken_range_utc": {"start": start, "end": end},
+        }
+        rule.update(extra)
+        return rule
+
+    def test_contained_range_same_album_warns(self):
+        """A narrower range feeding the same album with the same filters is redundant."""
+        validator = ConfigValidator({
             "mode": "add_only",
             "rules": [
-                {
-                    "id": "test-rule",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-12-31T23:59:59.999Z",
-                        "end": "2025-01-01T00:00:00.000Z",  # End before start!
-                    },
-                }
+                self._rule("year", "Photos", "2025-01-01T00:00:00Z", "2026-01-01T00:00:00Z"),
+                self._rule("summer", "Photos", "2025-06-01T00:00:00Z", "2025-09-01T00:00:00Z"),
+                self._rule("next-year", "Photos", "2025-12-01T00:00:00Z", "2026-02-01T00:00:00Z"),
             ],
-        }
+        })
 
-        try:
-            validate_config(config)
-            assert False, "Should have raised ConfigValidationError"
-        except ConfigValidationError as e:
-            assert "start date must be before end date" in str(e)
+        assert validator.validate() is True
 
-    def test_invalid_asset_types(self):
-        """Test that invalid asset types are caught."""
-        config = {
+        redundant = [w for w in validator.warnings if "fully covered" in w]
+        assert len(redundant) == 1
+        assert redundant[0].startswith("Rule 'summer'")
+        assert "Rule 'year'" in redundant[0]
+
+    def test_different_album_or_filters_not_redundant(self):
+        """Overlapping ranges are fine when the album or filters differ."""
+        validator = ConfigValidator({
             "mode": "add_only",
             "rules": [
-                {
-                    "id": "test-rule",
-                    "album_name": "Test Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                    "filters": {
-                        "asset_types": ["INVALID_TYPE"],
-                    },
-                }
+                self._rule("year", "Photos", "2025-01-01T00:00:00Z", "2026-01-01T00:00:00Z"),
+                self._rule("summer", "Summer", "2025-06-01T00:00:00Z", "2025-09-01T00:00:00Z"),
+                self._rule(
+                    "summer-favorites", "Photos",
+                    "2025-06-01T00:00:00Z", "2025-09-01T00:00:00Z",
+                    filters={"is_favorite": True},
+                ),
             ],
-        }
+        })
+
+        assert validator.validate() is True
+        assert not any("fully covered" in w for w in validator.warnings)
+
+    @pytest.mark.parametrize("extra", [
+        {"share_with": ["alice@example.com"]},
+        {"mode": "sync"},
+    ])
+    def test_different_sharing_or_mode_not_redundant(self, extra):
+        """A contained range isn't redundant when its rule shares or syncs differently."""
+        validator = ConfigValidator({
+            "mode": "add_only",
+            "rules": [
+                self._rule("year", "Photos", "2025-01-01T00:00:00Z", "2026-01-01T00:00:00Z"),
+                self._rule("summer", "Photos", "2025-06-01T00:00:00Z", "2025-09-01T00:00:00Z", **extra),
+            ],
+        })
 
-        try:
-            validate_config(config)
-            assert False, "Should have raised ConfigValidationError"
-        except ConfigValidationError as e:
-            assert "Invalid asset_type" in str(e)
-            assert "INVALID_TYPE" in str(e)
+        assert validator.validate() is True
+        assert not any("fully covered" in w for w in validator.warnings)
 
 
 class TestRuleFilters:
@@ -335,24 +297,10 @@ class TestRuleFilters:
 class TestBackwardCompatibility:
     """Test backward compatibility with old config format."""
 
-    def test_old_format_without_filters(self):
+    def test_old_format_without_filters(self, base_config):
         """Test that old format without filters section still works."""
-        config = {
-            "mode": "add_only",
-            "rules": [
-                {
-                    "id": "old-format-rule",
-                    "album_name": "Old Format Album",
-                    "taken_range_utc": {
-                        "start": "2025-01-01T00:00:00.000Z",
-                        "end": "2025-12-31T23:59:59.999Z",
-                    },
-                }
-            ],
-        }
-
         # Should pass validation
-        result = validate_config(config)
+        result = validate_config(base_config)
         assert result is True
 
         # Should default to IMAGE only
@@ -416,57 +364,4 @@ def test_comprehensive_example():
 
 
 if __name__ == "__main__":
-    # Run tests manually
-    print("Running validation and filtering tests...\n")
-
-    test_validator = TestConfigValidation()
-    test_filters = TestRuleFilters()
-    test_compat = TestBackwardCompatibility()
-
-    tests = [
-        ("Valid basic config", test_validator.test_valid_basic_config),
-        ("Valid config with filters", test_validator.test_valid_config_with_filters),
-        ("Invalid mode", test_validator.test_invalid_mode),
-        ("Missing required fields", test_validator.test_missing_required_fields),
-        ("Duplicate rule IDs", test_validator.test_duplicate_rule_ids),
-        ("Invalid date format", test_validator.test_invalid_date_format),
-        ("Valid date formats", test_validator.test_valid_date_formats),
-        ("Start after end date", test_validator.test_start_after_end_date),
-        ("Invalid asset types", test_validator.test_invalid_asset_types),
-        ("Default filters", test_filters.test_default_filters),
-        ("Parse is_favorite", test_filters.test_parse_filters_is_favorite),
-        ("Parse asset_types", test_filters.test_parse_filters_asset_types),
-        ("Parse camera", test_filters.test_parse_filters_camera),
-        ("Parse tags", test_filters.test_parse_filters_tags),
-        ("Parse complex filters", test_filters.test_parse_complex_filters),
-        (
-            "Asset types normalized",
-            test_filters.test_asset_types_normalized_to_uppercase,
-        ),
-        ("Old format compatibility", test_compat.test_old_format_without_filters),
-        ("Comprehensive example", test_comprehensive_example),
-    ]
-
-    passed = 0
-    failed = 0
-
-    for name, test_func in tests:
-        try:
-            test_func()
-            print(f"✓ {name}")
-            passed += 1
-        except AssertionError as e:
-            print(f"✗ {name}: {str(e)}")
-            failed += 1
-        except Exception as e:
-            print(f"✗ {name}: Unexpected error - {str(e)}")
-            failed += 1
-
-    print(f"\n{passed} passed, {failed} failed")
-
-    if failed == 0:
-        print("\n✓ All tests passed!")
-        sys.exit(0)
-    else:
-        print(f"\n✗ {failed} test(s) failed")
-        sys.exit(1)
+    pytest.main([__file__, "-v"])
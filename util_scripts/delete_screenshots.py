@@ -7,7 +7,9 @@ This will PERMANENTLY DELETE the image files from Immich.
 import logging
 import os
 import sys
-from typing import Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Collection, List
 from dotenv import load_dotenv
 
 # Add src to path so we can import the client
@@ -25,42 +27,93 @@ logger = logging.getLogger(__name__)
 
 ALBUM_NAME = "Screenshots for Review"
 
+# Delete batches in flight at once (well under the client's connection pool size)
+DELETE_WORKERS = 4
 
-def delete_assets(client: ImmichClient, asset_ids: Set[str], batch_size: int = 100) -> None:
+
+def _delete_batch(client: ImmichClient, url: str, chunk: List[str]) -> int:
+    """
+    Delete one batch of assets.
+
+    Args:
+        client: ImmichClient instance
+        url: Asset deletion endpoint
+        chunk: Asset IDs in this batch
+
+    Returns:
+        Number of assets deleted
+    """
+    response = client.session.delete(url, json={"ids": chunk})
+    try:
+        response.raise_for_status()
+    except Exception:
+        logger.error(f"Response: {response.text}")
+        raise
+    return len(chunk)
+
+
+def delete_assets(
+    client: ImmichClient,
+    asset_ids: Collection[str],
+    batch_size: int = 500,
+    max_workers: int = DELETE_WORKERS,
+) -> None:
     """
     Delete assets from Immich permanently.
 
+    More than one batch's worth of IDs is first sent as a single request; if
+    the server rejects it as too large (413), batches are sent concurrently
+    over the client's pooled session instead. The first failed batch stops any
+    batches that haven't started yet and is re-raised.
+
     Args:
         client: ImmichClient instance
-        asset_ids: Set of asset IDs to delete
-        batch_size: Number of assets to delete per request
+        asset_ids: Asset IDs to delete (any sized collection, e.g. the album's set)
+        batch_size: Number of assets to delete per request when batching
+        max_workers: Number of batches in flight at once
     """
     if not asset_ids:
         logger.warning("No assets to delete.")
         return
 
     url = f"{client.base_url}/assets"
-    asset_list = list(asset_ids)
-    total = len(asset_list)
+    total = len(asset_ids)
     deleted = 0
 
+    if total > batch_size:
+        # The endpoint takes any number of IDs, so try a single request first
+        logger.info(f"Deleting {total} assets in one request...")
+        response = client.session.delete(url, json={"ids": list(asset_ids)})
+        if response.status_code != 413:
+            try:
+                response.raise_for_status()
+            except Exception as e:
+                logger.error(f"Failed to delete assets: {e}")
+                logger.error(f"Response: {response.text}")
+                raise
+            logger.info(f"Successfully deleted {total}/{total} assets")
+            return
+        logger.info("Request too large for the server; falling back to batches")
+
     logger.info(f"Deleting {total} assets in batches of {batch_size}...")
 
-    # Process in batches
-    for i in range(0, total, batch_size):
-        chunk = asset_list[i:i + batch_size]
-        payload = {"ids": chunk}
+    # Split into batches in one pass, without a full list copy to slice from
+    ids = iter(asset_ids)
+    chunks = list(iter(lambda: list(islice(ids, batch_size)), []))
 
-        try:
-            logger.info(f"Deleting batch {(i // batch_size) + 1}: assets {i + 1}-{min(i + batch_size, total)} of {total}")
-            response = client.session.delete(url, json=payload)
-            response.raise_for_status()
-            deleted += len(chunk)
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(chunks)))
+    try:
+        futures = [executor.submit(_delete_batch, client, url, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            try:
+                deleted += future.result()
+            except Exception as e:
+                logger.error(f"Failed to delete batch: {e}")
+                raise
             logger.info(f"Successfully deleted {deleted}/{total} assets")
-        except Exception as e:
-            logger.error(f"Failed to delete batch: {e}")
-            logger.error(f"Response: {response.text if 'response' in locals() else 'No response'}")
-            raise
+    finally:
+        # On failure, drop the batches that haven't started
+        executor.shutdown(cancel_futures=True)
 
 
 def main():
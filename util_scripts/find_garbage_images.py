@@ -21,29 +21,44 @@ Usage:
     # Use 8 parallel workers for faster processing
     python find_garbage_images.py --workers 8 --dry-run
 
+    # Cache thumbnails so re-runs with other thresholds skip the downloads
+    python find_garbage_images.py --cache-dir ~/.cache/immich-garbage --dry-run
+
 Requirements:
     pip install pillow opencv-python-headless requests python-dotenv
 """
 
 import argparse
+import hashlib
 import io
+import itertools
 import logging
 import os
 import sys
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
-from PIL import Image
+from PIL import Image, ImageStat
 
 try:
-    import cv2
     import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import cv2
     OPENCV_AVAILABLE = True
 except ImportError:
     OPENCV_AVAILABLE = False
-    print("Warning: opencv-python not available. Blur detection will be disabled.")
+    if NUMPY_AVAILABLE:
+        print("Warning: opencv-python not available. Blur detection will use a slower NumPy fallback.")
+    else:
+        print("Warning: opencv-python not available. Blur detection will be disabled.")
     print("Install with: pip install opencv-python-headless")
 
 # Add src directory to path (go up one level from util_scripts, then to src)
@@ -59,10 +74,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Workers spend most of their time waiting on HTTP, so size the pool for I/O
+# rather than CPU (same heuristic as ThreadPoolExecutor's own default)
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
 
 class GarbageImageDetector:
     """Detect potentially garbage images using various quality metrics."""
 
+    # Rendition sizes served by Immich's /assets/{id}/thumbnail endpoint
+    THUMBNAIL_SIZES = ("thumbnail", "preview")
+
     def __init__(
         self,
         client: ImmichClient,
@@ -71,6 +93,9 @@ class GarbageImageDetector:
         contrast_threshold: int = 20,
         min_resolution: Optional[int] = None,
         min_issues: int = 1,
+        max_dimension: Optional[int] = None,
+        thumbnail_size: str = "preview",
+        cache_dir: Optional[Path] = None,
     ):
         """
         Initialize the garbage image detector.
@@ -83,9 +108,21 @@ class GarbageImageDetector:
                                Typical values: <20 very dark, 20-40 dark, >40 normal
             contrast_threshold: Standard deviation threshold (lower = less contrast)
                                Typical values: <15 very low, 15-30 low, >30 normal
-            min_resolution: Minimum pixel count (width * height), None to disable
+            min_resolution: Minimum pixel count (width * height) of the original
+                           image, None to disable
             min_issues: Minimum number of issues required to flag an image (default: 1)
                        Set to 2 to only flag images with multiple problems
+            max_dimension: Downsample thumbnails whose longest side exceeds this many
+                          pixels before scoring, None to analyze at full size.
+                          Downsampled images score higher on blur, so
+                          blur_threshold may need raising when this is set
+            thumbnail_size: Rendition to download and analyze, "preview" (large,
+                           what blur_threshold is tuned for) or "thumbnail" (small,
+                           fastest). Blur scores are much higher on the smaller
+                           rendition, so raise blur_threshold when using it
+            cache_dir: Directory to cache downloaded thumbnails in, so re-runs with
+                      different thresholds don't download them again. Never
+                      pruned; None (the default) disables caching
         """
         self.client = client
         self.blur_threshold = blur_threshold
@@ -93,10 +130,33 @@ class GarbageImageDetector:
         self.contrast_threshold = contrast_threshold
         self.min_resolution = min_resolution
         self.min_issues = min_issues
+        self.max_dimension = max_dimension
+        self.thumbnail_size = thumbnail_size
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _thumbnail_cache_path(self, asset_id: str) -> Optional[Path]:
+        """
+        Get the cache file for an asset's thumbnail.
+
+        The key covers the server and thumbnail size as well as the asset ID,
+        so changing either never serves a stale image.
+
+        Args:
+            asset_id: ID of the asset
+
+        Returns:
+            Path of the cache file, or None if caching is disabled
+        """
+        if self.cache_dir is None:
+            return None
+        key = f"{self.client.base_url}|{asset_id}|{self.thumbnail_size}"
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.bin"
 
     def download_image_thumbnail(self, asset_id: str, session: requests.Session) -> Optional[Image.Image]:
         """
-        Download a thumbnail of the image for analysis.
+        Download a thumbnail of the image for analysis, or read it from the cache.
 
         Args:
             asset_id: ID of the asset to download
@@ -106,75 +166,128 @@ class GarbageImageDetector:
             PIL Image object or None if failed
         """
         # Use thumbnail endpoint for faster downloads
-        # Format: preview is lower quality but faster, thumbnail is smaller
+        # Size: thumbnail is small and cheap to fetch, preview is larger but more accurate
         url = f"{self.client.base_url}/assets/{asset_id}/thumbnail"
+        cache_path = self._thumbnail_cache_path(asset_id)
 
         try:
-            response = session.get(url, params={"size": "preview"})
-            response.raise_for_status()
-            image = Image.open(io.BytesIO(response.content))
+            if cache_path is not None and cache_path.exists():
+                content = cache_path.read_bytes()
+            else:
+                response = session.get(url, params={"size": self.thumbnail_size})
+                response.raise_for_status()
+                content = response.content
+                if cache_path is not None:
+                    self._write_cache(cache_path, content)
+
+            image = Image.open(io.BytesIO(content))
+            # Only luminance is analyzed; for JPEGs this makes libjpeg decode
+            # the Y channel alone and skip colour conversion (no-op otherwise)
+            image.draft('L', image.size)
             return image
         except Exception as e:
             logger.warning(f"Failed to download image {asset_id}: {e}")
             return None
 
-    def calculate_blur(self, image: Image.Image) -> Optional[float]:
+    @staticmethod
+    def _write_cache(cache_path: Path, content: bytes) -> None:
         """
-        Calculate blur score using Laplacian variance.
-        Lower values indicate more blur.
+        Write a thumbnail to the cache, logging instead of failing on errors.
 
         Args:
-            image: PIL Image object
-
-        Returns:
-            Blur score (variance) or None if OpenCV not available
+            cache_path: Cache file to write
+            content: Raw thumbnail bytes
         """
-        if not OPENCV_AVAILABLE:
-            return None
+        # Write to a per-thread temp file and rename, so readers never see
+        # a partially written thumbnail
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Failed to cache thumbnail {cache_path.name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _laplacian_variance(gray: 'np.ndarray') -> float:
+        """
+        Calculate the variance of the Laplacian of an 8-bit grayscale array.
 
-        # Convert PIL to OpenCV format
-        img_array = np.array(image.convert('RGB'))
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        ksize is left at its default of 1, the 4-neighbour kernel that
+        blur_threshold and the documented score ranges were tuned with; ksize=3
+        is a different, higher-gain kernel that would rescale every score. That
+        kernel peaks at 4 * 255 on uint8 input, so a 16-bit signed output holds
+        it exactly at a quarter of the memory of CV_64F.
 
-        # Calculate Laplacian variance
-        laplacian = cv2.Laplacian(gray, cv2.CV_64F)
-        variance = laplacian.var()
+        Without OpenCV the same 4-neighbour stencil is applied with NumPy
+        slices over a reflect-padded copy, matching OpenCV's default
+        BORDER_REFLECT_101 so scores are identical either way.
 
-        return variance
+        Args:
+            gray: 2-D uint8 grayscale array
 
-    def calculate_brightness(self, image: Image.Image) -> float:
+        Returns:
+            Laplacian variance
+        """
+        if OPENCV_AVAILABLE:
+            laplacian = cv2.Laplacian(gray, cv2.CV_16S)
+        else:
+            padded = np.pad(gray.astype(np.int16), 1, mode='reflect')
+            laplacian = (
+                padded[:-2, 1:-1] + padded[2:, 1:-1]
+                + padded[1:-1, :-2] + padded[1:-1, 2:]
+                - 4 * padded[1:-1, 1:-1]
+            )
+        return float(laplacian.var())
+
+    def _analyze_gray(self, image: Image.Image) -> Tuple[Optional['np.ndarray'], float, float]:
         """
-        Calculate average brightness of the image.
+        Calculate brightness and contrast from a single grayscale conversion.
 
         Args:
             image: PIL Image object
 
         Returns:
-            Average brightness (0-255)
+            Tuple of (uint8 grayscale array for blur scoring or None without
+            NumPy, brightness, contrast)
         """
-        # Convert to grayscale and calculate mean
-        grayscale = image.convert('L')
-        pixels = list(grayscale.get_flattened_data())
-        return sum(pixels) / len(pixels)
+        # JPEGs are already decoded to 'L' (see download_image_thumbnail), where
+        # convert() would only make a copy
+        grayscale = image if image.mode == 'L' else image.convert('L')
+
+        # Box-downsample large thumbnails; scoring cost grows with pixel count
+        if self.max_dimension and max(grayscale.size) > self.max_dimension:
+            factor = -(-max(grayscale.size) // self.max_dimension)
+            grayscale = grayscale.reduce(factor)
+
+        if not NUMPY_AVAILABLE:
+            # PIL computes both from one histogram pass in C
+            stat = ImageStat.Stat(grayscale)
+            return None, stat.mean[0], stat.stddev[0]
+
+        gray = np.asarray(grayscale, dtype=np.uint8)
+        return gray, float(gray.mean()), float(gray.std())
 
-    def calculate_contrast(self, image: Image.Image) -> float:
+    @staticmethod
+    def _asset_dimensions(asset_info: Dict) -> Optional[Tuple[int, int]]:
         """
-        Calculate contrast (standard deviation of pixel values).
+        Get the original (width, height) of an asset from its search result.
+
+        The downloaded thumbnail is much smaller than the original, so its size
+        can't be used for the resolution check.
 
         Args:
-            image: PIL Image object
+            asset_info: Asset dict from the search results (with exifInfo)
 
         Returns:
-            Standard deviation of brightness
+            Tuple of (width, height), or None if not available
         """
-        grayscale = image.convert('L')
-        pixels = list(grayscale.get_flattened_data())
-
-        mean = sum(pixels) / len(pixels)
-        variance = sum((p - mean) ** 2 for p in pixels) / len(pixels)
-        std_dev = variance ** 0.5
-
-        return std_dev
+        exif = asset_info.get("exifInfo") or {}
+        width = exif.get("exifImageWidth") or asset_info.get("originalWidth")
+        height = exif.get("exifImageHeight") or asset_info.get("originalHeight")
+        if not width or not height:
+            return None
+        return width, height
 
     def analyze_image(self, asset_id: str, asset_info: Dict, session: requests.Session) -> Optional[Dict]:
         """
@@ -192,27 +305,33 @@ class GarbageImageDetector:
         if not image:
             return None
 
-        # Calculate metrics
-        blur_score = self.calculate_blur(image) if OPENCV_AVAILABLE else None
-        brightness = self.calculate_brightness(image)
-        contrast = self.calculate_contrast(image)
-        width, height = image.size
-        resolution = width * height
+        # Calculate the cheap metrics first
+        gray, brightness, contrast = self._analyze_gray(image)
+        dimensions = self._asset_dimensions(asset_info)
 
         # Determine if image should be flagged
         reasons = []
 
-        if blur_score is not None and blur_score < self.blur_threshold:
-            reasons.append(f"blurry (score: {blur_score:.1f})")
-
         if brightness < self.darkness_threshold:
             reasons.append(f"dark (brightness: {brightness:.1f})")
 
         if contrast < self.contrast_threshold:
             reasons.append(f"low contrast (std: {contrast:.1f})")
 
-        if self.min_resolution and resolution < self.min_resolution:
-            reasons.append(f"low resolution ({width}x{height})")
+        if self.min_resolution and dimensions is not None:
+            width, height = dimensions
+            if width * height < self.min_resolution:
+                reasons.append(f"low resolution ({width}x{height})")
+
+        # Blur can add at most one issue, so skip the Laplacian when even
+        # that couldn't reach min_issues
+        if len(reasons) + 1 < self.min_issues:
+            return None
+
+        # Laplacian runs directly on the 8-bit gray buffer, no cvtColor needed
+        blur_score = self._laplacian_variance(gray) if gray is not None else None
+        if blur_score is not None and blur_score < self.blur_threshold:
+            reasons.insert(0, f"blurry (score: {blur_score:.1f})")
 
         # Only flag if we have at least min_issues problems
         if len(reasons) < self.min_issues:
@@ -225,35 +344,25 @@ class GarbageImageDetector:
                 "blur_score": blur_score,
                 "brightness": brightness,
                 "contrast": contrast,
-                "resolution": f"{width}x{height}",
+                "resolution": f"{dimensions[0]}x{dimensions[1]}" if dimensions else "unknown",
             },
             "original_name": asset_info.get("originalFileName", "unknown"),
             "taken_date": asset_info.get("fileCreatedAt", "unknown"),
         }
 
-    def _process_single_asset(self, asset_id: str) -> Optional[Dict]:
+    def _process_single_asset(self, asset_id: str, asset_info: Dict, session: requests.Session) -> Optional[Dict]:
         """
-        Worker function to process a single asset (fetch metadata + analyze).
-        This function is thread-safe as it creates its own session.
+        Worker function to process a single asset (download + analyze).
 
         Args:
             asset_id: ID of the asset to process
+            asset_info: Asset dict from the search results
+            session: Requests session shared by all workers for downloads
 
         Returns:
             Dict with analysis results, or None if not flagged or error occurred
         """
-        # Create thread-local session with larger connection pool for thread safety
-        session = requests.Session()
-        # Configure HTTPAdapter with larger pool to handle concurrent requests
-        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50)
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        session.headers.update(self.client.headers)
-
         try:
-            # Get asset metadata
-            asset_info = self.client.get_asset_metadata(asset_id)
-
             # Analyze image
             result = self.analyze_image(asset_id, asset_info, session)
             if result:
@@ -263,8 +372,6 @@ class GarbageImageDetector:
         except Exception as e:
             logger.warning(f"Failed to process asset {asset_id}: {e}")
             return None
-        finally:
-            session.close()
 
     def find_garbage_images(
         self,
@@ -276,39 +383,48 @@ class GarbageImageDetector:
 
         Args:
             limit: Maximum number of images to analyze (for testing)
-            workers: Number of parallel workers (default: cpu_count)
+            workers: Number of parallel workers (default: DEFAULT_WORKERS)
 
         Returns:
             List of flagged image analysis results
         """
         logger.info("Fetching all IMAGE assets from Immich...")
 
-        # Get all image assets
-        asset_ids = self.client.search_assets(
-            asset_types=["IMAGE"],
-            default_to_image=True,
-        )
+        # Get all image assets; the search results carry the file name, date
+        # and original dimensions, so no per-asset metadata request is needed
+        assets_by_id = self.client.search_asset_details(asset_types=["IMAGE"], with_exif=True)
+        asset_ids = assets_by_id.keys()
 
         total_assets = len(asset_ids)
         logger.info(f"Found {total_assets} total images to analyze")
 
         if limit:
-            asset_ids = list(asset_ids)[:limit]
+            asset_ids = list(itertools.islice(asset_ids, limit))
             logger.info(f"Limiting analysis to first {len(asset_ids)} images")
 
         # Determine number of workers
         if workers is None:
-            workers = os.cpu_count() or 4
+            workers = DEFAULT_WORKERS
         logger.info(f"Using {workers} parallel workers")
 
         # Process images in parallel
         flagged_images = []
         processed = 0
 
-        with ThreadPoolExecutor(max_workers=workers) as executor:
+        # One session for all workers, so connections are reused across assets
+        # instead of paying a TCP/TLS handshake per download
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers * 2)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(self.client.headers)
+
+        with session, ThreadPoolExecutor(max_workers=workers) as executor:
             # Submit all tasks
             future_to_asset_id = {
-                executor.submit(self._process_single_asset, asset_id): asset_id
+                executor.submit(
+                    self._process_single_asset, asset_id, assets_by_id[asset_id], session
+                ): asset_id
                 for asset_id in asset_ids
             }
 
@@ -470,6 +586,30 @@ Thresholds Guide:
              "Set to 2 to only flag images with multiple problems (e.g., blurry AND dark)"
     )
 
+    parser.add_argument(
+        "--thumbnail-size",
+        choices=GarbageImageDetector.THUMBNAIL_SIZES,
+        default="preview",
+        help="Image size to download for analysis (default: preview). "
+             "thumbnail is much faster to fetch, but scores higher on blur, so raise --blur-threshold with it"
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        metavar="DIR",
+        help="Cache downloaded thumbnails in DIR so re-runs skip the downloads (disabled by default). "
+             "The cache is never pruned; delete the directory when done tuning"
+    )
+
+    parser.add_argument(
+        "--max-dimension",
+        type=int,
+        metavar="PIXELS",
+        help="Downsample images larger than this (longest side) before analysis, "
+             "e.g. 512. Blur scores rise when downsampling, so raise --blur-threshold to match"
+    )
+
     parser.add_argument(
         "--limit",
         type=int,
@@ -481,7 +621,7 @@ Thresholds Guide:
         "--workers",
         type=int,
         metavar="N",
-        help=f"Number of parallel workers (default: {os.cpu_count() or 4})"
+        help=f"Number of parallel workers (default: {DEFAULT_WORKERS})"
     )
 
     parser.add_argument(
@@ -520,6 +660,9 @@ Thresholds Guide:
         contrast_threshold=args.contrast_threshold,
         min_resolution=args.min_resolution,
         min_issues=args.min_issues,
+        max_dimension=args.max_dimension,
+        thumbnail_size=args.thumbnail_size,
+        cache_dir=args.cache_dir.expanduser() if args.cache_dir else None,
     )
 
     # Print detection configuration
@@ -532,6 +675,11 @@ Thresholds Guide:
     logger.info(f"Min issues to flag: {args.min_issues} (1=any issue, 2=multiple issues required)")
     if args.min_resolution:
         logger.info(f"Min resolution: {args.min_resolution} pixels")
+    logger.info(f"Thumbnail size: {args.thumbnail_size}")
+    if args.cache_dir:
+        logger.info(f"Thumbnail cache: {args.cache_dir}")
+    if args.max_dimension:
+        logger.info(f"Max analysis dimension: {args.max_dimension} pixels")
     if args.limit:
         logger.info(f"Analysis limit: {args.limit} images")
     if args.workers:
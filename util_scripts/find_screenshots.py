@@ -8,7 +8,7 @@ and adds them to a "Screenshots for Review" album.
 import logging
 import os
 import sys
-from typing import Set, Tuple
+from typing import Dict, Set, Tuple
 from dotenv import load_dotenv
 
 # Add src to path so we can import the client
@@ -29,39 +29,34 @@ TARGET_RESOLUTIONS = [
     (1320, 2868),  # New phone
     (1080, 2400),  # Old phone
 ]
+TARGET_RESOLUTION_SET = frozenset(TARGET_RESOLUTIONS)
 
 ALBUM_NAME = "Screenshots for Review"
 ALBUM_DESCRIPTION = "Screenshots detected by resolution (1320x2868 or 1080x2400)"
 
 
-def get_asset_resolution(client: ImmichClient, asset_id: str) -> Tuple[int, int]:
+def get_asset_resolution(asset: Dict) -> Tuple[int, int]:
     """
     Get the resolution (width, height) of an asset.
 
     Args:
-        client: ImmichClient instance
-        asset_id: Asset ID to fetch
+        asset: Asset dict from the search results (with exifInfo)
 
     Returns:
         Tuple of (width, height) or (0, 0) if not available
     """
-    try:
-        metadata = client.get_asset_metadata(asset_id)
-        exif = metadata.get("exifInfo", {})
+    exif = asset.get("exifInfo") or {}
 
-        # Try to get dimensions from exif
-        width = exif.get("exifImageWidth", 0)
-        height = exif.get("exifImageHeight", 0)
+    # Try to get dimensions from exif
+    width = exif.get("exifImageWidth") or 0
+    height = exif.get("exifImageHeight") or 0
 
-        # Some assets might have dimensions in different fields
-        if width == 0 or height == 0:
-            width = metadata.get("originalWidth", 0)
-            height = metadata.get("originalHeight", 0)
+    # Some assets might have dimensions in different fields
+    if width == 0 or height == 0:
+        width = asset.get("originalWidth") or 0
+        height = asset.get("originalHeight") or 0
 
-        return (width, height)
-    except Exception as e:
-        logger.warning(f"Failed to get metadata for asset {asset_id}: {e}")
-        return (0, 0)
+    return (width, height)
 
 
 def find_screenshots(client: ImmichClient, batch_size: int = 100) -> Set[str]:
@@ -77,11 +72,9 @@ def find_screenshots(client: ImmichClient, batch_size: int = 100) -> Set[str]:
     """
     logger.info("Searching for all image assets...")
 
-    # Get all image assets (no date filters)
-    all_assets = client.search_assets(
-        asset_types=["IMAGE"],
-        default_to_image=True
-    )
+    # Get all image assets (no date filters). The search results include the
+    # EXIF dimensions, so no per-asset metadata request is needed
+    all_assets = client.search_asset_details(asset_types=["IMAGE"], with_exif=True)
 
     total_assets = len(all_assets)
     logger.info(f"Found {total_assets} total image assets. Checking resolutions...")
@@ -89,17 +82,17 @@ def find_screenshots(client: ImmichClient, batch_size: int = 100) -> Set[str]:
     matching_assets = set()
     checked_count = 0
 
-    for asset_id in all_assets:
+    for asset_id, asset in all_assets.items():
         checked_count += 1
 
         # Log progress every batch_size assets
         if checked_count % batch_size == 0:
             logger.info(f"Progress: {checked_count}/{total_assets} assets checked, {len(matching_assets)} matches found")
 
-        width, height = get_asset_resolution(client, asset_id)
+        width, height = get_asset_resolution(asset)
 
         # Check if resolution matches any target
-        if (width, height) in TARGET_RESOLUTIONS:
+        if (width, height) in TARGET_RESOLUTION_SET:
             logger.info(f"Found screenshot: {asset_id} ({width}x{height})")
             matching_assets.add(asset_id)
 